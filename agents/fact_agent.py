@@ -8,6 +8,10 @@ from langchain_community.tools.tavily_search import TavilySearchResults
 from typing import Optional, Type, List
 from pydantic import BaseModel, Field
 
+from services.cache import fact_cache
+from services.model_router import get_llm
+from services.resilience import get_breaker
+
 
 class FactInput(BaseModel):
     player_name: str = Field(description="The name of the player to get facts for")
@@ -29,9 +33,7 @@ class GoogleFactTool(BaseTool):
         run_manager: Optional[CallbackManagerForToolRun] = None
     ) -> str:
         try:
-            tavily_tool = TavilySearchResults(k=5)
-            query = f"latest interesting news or fact about {player_name} football"
-            results = tavily_tool.run(query)
+            results = get_breaker("tavily").call(self._search, player_name)
 
             if not results:
                 return f"No relevant news found for {player_name}."
@@ -39,12 +41,23 @@ class GoogleFactTool(BaseTool):
             for result in results:
                 summary = result.get("content") or result.get("snippet")
                 if summary and not any(fact.lower() in summary.lower() for fact in exclude_facts or []):
+                    fact_cache.set(player_name, summary)
                     return f"{summary} (Source: {result.get('url')})"
 
             return f"No new or unique facts found for {player_name}."
         except Exception as e:
             return f"Error fetching Google facts for {player_name}: {str(e)}"
 
+    @staticmethod
+    def _search(player_name: str) -> list:
+        tavily_tool = TavilySearchResults(k=5)
+        query = f"latest interesting news or fact about {player_name} football"
+        results = tavily_tool.run(query)
+        # The Tavily tool reports failures as a string rather than raising
+        if isinstance(results, str):
+            raise RuntimeError(results)
+        return results
+
 
 class FactAgent:
     def __init__(self, llm: ChatOpenAI):
@@ -91,7 +104,7 @@ If nothing is found, return a graceful message."""),
                 exclude_facts: Optional[List[str]] = None,
                 run_manager: Optional[CallbackManagerForToolRun] = None
             ) -> str:
-                agent = FactAgent(ChatOpenAI(temperature=0.3))
+                agent = FactAgent(get_llm("fact"))
                 return agent.get_fact(player_name, exclude_facts)
 
         return FactAgentTool()
@@ -99,7 +112,5 @@ If nothing is found, return a graceful message."""),
 
 # Backward compatibility
 def fact_agent(player_name: str) -> str:
-    from config import OPENAI_API_KEY
-    llm = ChatOpenAI(openai_api_key=OPENAI_API_KEY, temperature=0.3, model="gpt-4o")
-    agent = FactAgent(llm)
+    agent = FactAgent(get_llm("fact"))
     return agent.get_fact(player_name)
@@ -6,9 +6,19 @@ from langchain_core.callbacks.manager import CallbackManagerForToolRun
 from langchain.memory import ConversationBufferMemory
 from typing import Optional, Type, Dict, Any, List
 from pydantic import BaseModel, Field
-import streamlit as st
 from datetime import datetime, timedelta
 
+from services.cache import memory_cache
+from services.model_router import get_llm
+
+
+def record_fact(player_name: str, fact: str) -> None:
+    """Mark a fact as shown for a player"""
+    memory_cache.set(player_name, {
+        "fact": fact,
+        "timestamp": datetime.now().isoformat()
+    })
+
 
 class MemoryInput(BaseModel):
     """Input schema for memory operations"""
@@ -31,14 +41,7 @@ class MemoryStoreTool(BaseTool):
         run_manager: Optional[CallbackManagerForToolRun] = None
     ) -> str:
         try:
-            if "shown_facts" not in st.session_state:
-                st.session_state.shown_facts = {}
-
-            if "fact_timestamps" not in st.session_state:
-                st.session_state.fact_timestamps = {}
-
-            st.session_state.shown_facts[player_name] = fact
-            st.session_state.fact_timestamps[player_name] = datetime.now()
+            record_fact(player_name, fact)
 
             return f"Successfully stored fact for {player_name}"
         except Exception as e:
@@ -59,17 +62,13 @@ class MemoryRetrieveTool(BaseTool):
         run_manager: Optional[CallbackManagerForToolRun] = None
     ) -> str:
         try:
-            if "shown_facts" not in st.session_state:
-                return f"No facts stored for {player_name}"
+            stored = memory_cache.get(player_name, allow_stale=True)
+            if stored:
+                timestamp = datetime.fromisoformat(stored["timestamp"])
+                if datetime.now() - timestamp < timedelta(hours=1):
+                    return f"Recent fact for {player_name}: {stored['fact']}"
 
-            stored_fact = st.session_state.shown_facts.get(player_name)
-            if stored_fact:
-                if "fact_timestamps" in st.session_state:
-                    timestamp = st.session_state.fact_timestamps.get(player_name)
-                    if timestamp and datetime.now() - timestamp < timedelta(hours=1):
-                        return f"Recent fact for {player_name}: {stored_fact}"
-
-                return f"Stored fact for {player_name}: {stored_fact}"
+                return f"Stored fact for {player_name}: {stored['fact']}"
             else:
                 return f"No facts stored for {player_name}"
         except Exception as e:
@@ -90,11 +89,8 @@ class MemoryCheckTool(BaseTool):
         run_manager: Optional[CallbackManagerForToolRun] = None
     ) -> str:
         try:
-            if "shown_facts" not in st.session_state:
-                return "No duplicates found - fact is new"
-
-            stored_fact = st.session_state.shown_facts.get(player_name)
-            if stored_fact and stored_fact.lower().strip() == fact.lower().strip():
+            stored = memory_cache.get(player_name, allow_stale=True)
+            if stored and stored["fact"].lower().strip() == fact.lower().strip():
                 return f"Duplicate detected - this fact was already shown for {player_name}"
 
             return "No duplicates found - fact is new"
@@ -106,7 +102,7 @@ class MemoryAgent:
     """Agent responsible for managing memory and avoiding repetition"""
 
     def __init__(self, llm: Optional[ChatOpenAI] = None):
-        self.llm = llm or ChatOpenAI(temperature=0)
+        self.llm = llm or get_llm("memory")
         self.tools = [
             MemoryStoreTool(),
             MemoryRetrieveTool(),
@@ -183,6 +179,10 @@ When managing memory:
                 fact: Optional[str] = None,
                 run_manager: Optional[CallbackManagerForToolRun] = None
             ) -> str:
+                # Speculative runs must not mark facts as shown before anyone has seen them;
+                # the caller stores the fact when it actually serves the commentary
+                if action == "store" and fact and run_manager and run_manager.metadata.get("defer_memory_writes"):
+                    return f"Fact for {player_name} will be stored once the commentary is shown"
                 agent = MemoryAgent()
                 if action == "store" and fact:
                     return agent.store_fact(player_name, fact)
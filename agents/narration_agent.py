@@ -7,6 +7,8 @@ from langchain.schema import HumanMessage, SystemMessage
 from typing import Optional, Type, Dict, Any
 from pydantic import BaseModel, Field
 
+from services.model_router import get_llm, invoke_narration
+
 
 class NarrationInput(BaseModel):
     """Input schema for NarrationAgent"""
@@ -54,8 +56,6 @@ class CommentaryTool(BaseTool):
             
             style_prompt = style_prompts.get(style, style_prompts["energetic_commentator"])
             
-            llm = ChatOpenAI(temperature=0.8)  # Higher temperature for creativity
-            
             messages = [
                 SystemMessage(content=f"""
                 You are a professional football commentator. {style_prompt}
@@ -72,7 +72,7 @@ class CommentaryTool(BaseTool):
                 """)
             ]
             
-            response = llm.invoke(messages)
+            response = invoke_narration(messages)
             return response.content.strip()
             
         except Exception as e:
@@ -152,7 +152,7 @@ When creating commentary:
                 style: str = "energetic_commentator",
                 run_manager: Optional[CallbackManagerForToolRun] = None
             ) -> str:
-                agent = NarrationAgent(ChatOpenAI(temperature=0.8))
+                agent = NarrationAgent(get_llm("narration_planner"))
                 data = {
                     "player": player_name,
                     "stat": stat,
@@ -166,7 +166,30 @@ When creating commentary:
 # Backward compatibility function
 def narration_agent(data: Dict[str, str]) -> str:
     """Legacy function for backward compatibility"""
-    from config import OPENAI_API_KEY
-    llm = ChatOpenAI(openai_api_key=OPENAI_API_KEY, temperature=0.8, model="gpt-4o")
-    agent = NarrationAgent(llm)
-    return agent.generate_commentary(data)
\ No newline at end of file
+    agent = NarrationAgent(get_llm("narration_planner"))
+    return agent.generate_commentary(data)
+
+def live_event_commentary(event: Dict[str, Any]) -> str:
+    """Quick one-shot commentary line for a single live match event"""
+    try:
+        minute = f"{event.get('minute')}+{event['extra']}" if event.get("extra") else event.get("minute")
+        score = event.get("score") or {}
+        messages = [
+            SystemMessage(content="""
+            You are a passionate live football commentator calling the match as it happens.
+            React to the event in one or two punchy sentences with a bit of banter. Never invent
+            events, players or scores that are not in the data you are given.
+            """),
+            HumanMessage(content=f"""
+            Minute: {minute}
+            Event: {event.get('type')} - {event.get('detail')}
+            Team: {event.get('team')}
+            Player: {event.get('player')}
+            Assist: {event.get('assist') or 'none'}
+            Score: {score.get('home')} - {score.get('away')}
+            """)
+        ]
+        response = invoke_narration(messages)
+        return response.content.strip()
+    except Exception as e:
+        return f"Error generating live commentary: {str(e)}"
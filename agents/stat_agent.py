@@ -7,6 +7,7 @@ from typing import Optional, Type, Dict, Any
 from pydantic import BaseModel, Field
 
 from services.football_api import get_player_stat
+from services.model_router import get_llm
 
 
 class StatInput(BaseModel):
@@ -88,7 +89,7 @@ Be concise but informative in your responses."""),
                 player_id: str, 
                 run_manager: Optional[CallbackManagerForToolRun] = None
             ) -> str:
-                agent = StatAgent(ChatOpenAI(temperature=0))
+                agent = StatAgent(get_llm("stat"))
                 return agent.get_stat(player_id)
         
         return StatAgentTool()
@@ -97,7 +98,5 @@ Be concise but informative in your responses."""),
 # Backward compatibility function
 def stat_agent(player_id: str) -> str:
     """Legacy function for backward compatibility"""
-    from config import OPENAI_API_KEY
-    llm = ChatOpenAI(openai_api_key=OPENAI_API_KEY, temperature=0, model="gpt-4o")
-    agent = StatAgent(llm)
+    agent = StatAgent(get_llm("stat"))
     return agent.get_stat(player_id)
\ No newline at end of file
@@ -0,0 +1,332 @@
+"""Concurrent-session load test for the commentary flow.
+
+Simulates N users clicking players from ``data/formations.json`` against local
+stand-ins for OpenAI, Tavily and API-Football with configurable injected latency,
+then reports throughput, latency percentiles, peak RSS, peak thread count and
+upstream calls per commentary. The stand-ins run in their own process, so RSS and
+threads are the app's alone: the test process in flow mode, summed over the
+per-session processes in streamlit mode.
+
+    python -m benchmarks.load_test --sessions 20 --clicks 5 --openai-latency-ms 400
+    python -m benchmarks.load_test --save-baseline        # record benchmarks/baseline.json
+    python -m benchmarks.load_test                        # exits 1 on regression vs the baseline
+    python -m benchmarks.load_test --mode streamlit       # drive main.py through AppTest
+
+Run from the repository root.
+"""
+import argparse
+import asyncio
+import json
+import math
+import multiprocessing
+import os
+import random
+import resource
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+ROOT = Path(__file__).resolve().parent.parent
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from standin import football_server, openai_server, tavily_server
+from standin.common import LatencyInjector, UpstreamStats, start_in_thread
+
+
+DEFAULT_BASELINE = ROOT / "benchmarks" / "baseline.json"
+
+# Metric -> (higher is worse, absolute slack added on top of the relative tolerance)
+GATED_METRICS = {
+    "throughput_per_s": (False, 0.0),
+    "latency_p50_s": (True, 0.05),
+    "latency_p95_s": (True, 0.05),
+    "latency_p99_s": (True, 0.05),
+    "peak_rss_mb": (True, 10.0),
+    "peak_threads": (True, 2),
+    "upstream_calls_per_commentary": (True, 0.5),
+    "degraded_ratio": (True, 0.05),
+}
+
+
+def percentile(values: List[float], pct: float) -> float:
+    """Nearest-rank percentile"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, math.ceil(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+class ResourceSampler:
+    """Samples the live thread count in the background; RSS comes from the kernel's peak"""
+
+    def __init__(self, interval: float = 0.05):
+        self.interval = interval
+        self.peak_threads = threading.active_count()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="resource-sampler", daemon=True)
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            self.peak_threads = max(self.peak_threads, threading.active_count())
+
+    def __enter__(self) -> "ResourceSampler":
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self._stop.set()
+        self._thread.join()
+
+    @staticmethod
+    def peak_rss_mb() -> float:
+        # ru_maxrss is KiB on Linux and bytes on macOS
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def point_tavily_at(url: str) -> None:
+    # The Tavily wrapper has no base URL setting, only a module constant
+    from langchain_community.utilities import tavily_search
+    tavily_search.TAVILY_API_URL = url
+
+
+def _serve_upstreams(conn, args) -> None:
+    """Stand-in process: start every stand-in, send their URLs, then answer call-count requests"""
+    upstreams = {
+        "openai": (openai_server, args.openai_latency_ms),
+        "tavily": (tavily_server, args.tavily_latency_ms),
+        "api_football": (football_server, args.football_latency_ms),
+    }
+    stats: Dict[str, UpstreamStats] = {}
+    urls: Dict[str, str] = {}
+    for name, (module, latency_ms) in upstreams.items():
+        stats[name] = UpstreamStats()
+        latency = LatencyInjector(latency_ms, args.jitter_ms, args.tail_ratio, args.tail_ms, seed=args.seed)
+        if module is football_server:
+            server = module.serve(None, port=0, latency=latency, stats=stats[name])
+        else:
+            server = module.serve(port=0, latency=latency, stats=stats[name])
+        urls[name] = start_in_thread(server)
+    conn.send(urls)
+
+    try:
+        while conn.recv() == "calls":
+            conn.send({name: upstream.total() for name, upstream in stats.items()})
+    except EOFError:
+        pass
+
+
+class Upstreams:
+    """The stand-ins, running in a separate process so they do not count towards the app's footprint"""
+
+    def __init__(self, args):
+        context = multiprocessing.get_context("spawn")
+        self._conn, child_conn = context.Pipe()
+        self._process = context.Process(target=_serve_upstreams, args=(child_conn, args), daemon=True)
+        self._process.start()
+        self.urls: Dict[str, str] = self._conn.recv()
+
+    def calls(self) -> Dict[str, int]:
+        """Requests each stand-in has served so far"""
+        self._conn.send("calls")
+        return self._conn.recv()
+
+    def stop(self) -> None:
+        self._conn.send("stop")
+        self._process.join()
+
+
+def start_upstreams(args) -> Upstreams:
+    """Start the stand-ins and point the app's configuration at them"""
+    upstreams = Upstreams(args)
+    urls = upstreams.urls
+
+    # Must happen before config.py is imported
+    os.environ["OPENAI_API_KEY"] = "stand-in"
+    os.environ["OPENAI_BASE_URL"] = os.environ["OPENAI_API_BASE"] = f"{urls['openai']}/v1"
+    os.environ["TAVILY_API_KEY"] = "stand-in"
+    os.environ["API_FOOTBALL_KEY"] = "stand-in"
+    os.environ["API_FOOTBALL_BASE_URL"] = urls["api_football"]
+    point_tavily_at(urls["tavily"])
+    return upstreams
+
+
+def load_players() -> List[Dict[str, Any]]:
+    with open(ROOT / "data" / "formations.json") as f:
+        formations = json.load(f)
+    return [p for players in formations.values() for p in players]
+
+
+async def run_flow_sessions(args, players) -> List[Tuple[float, bool]]:
+    from orchestration.flow import run_agent_flow
+
+    async def session(index: int) -> List[Tuple[float, bool]]:
+        rng = random.Random(args.seed + index)
+        samples = []
+        for _ in range(args.clicks):
+            player = rng.choice(players)
+            start = time.perf_counter()
+            result = await run_agent_flow(player["id"], player["name"])
+            samples.append((time.perf_counter() - start, not result or bool(result.get("degraded"))))
+            if args.think_ms:
+                await asyncio.sleep(args.think_ms / 1000)
+        return samples
+
+    results = await asyncio.gather(*(session(i) for i in range(args.sessions)))
+    return [sample for samples in results for sample in samples]
+
+
+def _streamlit_session(job) -> Tuple[List[Tuple[float, bool]], int, float]:
+    """One simulated user driving main.py through AppTest, in its own process"""
+    from streamlit.testing.v1 import AppTest
+
+    index, args, players, tavily_url = job
+    point_tavily_at(tavily_url)
+    rng = random.Random(args.seed + index)
+    app = AppTest.from_file(str(ROOT / "main.py"), default_timeout=args.timeout)
+    samples = []
+    with ResourceSampler() as sampler:
+        # Loading the page is not a pick; each click then picks a different player
+        app.run()
+        current = None
+        for _ in range(args.clicks):
+            current = rng.choice([p for p in players if p["name"] != current])["name"]
+            start = time.perf_counter()
+            app.selectbox[0].select(current).run()
+            degraded = bool(app.exception) or any("Quick take" in c.value for c in app.sidebar.caption)
+            samples.append((time.perf_counter() - start, degraded))
+            if args.think_ms:
+                time.sleep(args.think_ms / 1000)
+    return samples, sampler.peak_threads, sampler.peak_rss_mb()
+
+
+def run_streamlit_sessions(args, players, urls) -> Tuple[List[Tuple[float, bool]], int, float]:
+    """Samples plus peak threads and RSS summed over the session processes (the driver is not the app)"""
+    # AppTest swaps a process-global runtime on every run, so sessions cannot share a process
+    context = multiprocessing.get_context("spawn")
+    jobs = [(index, args, players, urls["tavily"]) for index in range(args.sessions)]
+    with context.Pool(processes=args.sessions) as pool:
+        results = pool.map(_streamlit_session, jobs)
+
+    samples = [sample for samples, _, _ in results for sample in samples]
+    return samples, sum(threads for _, threads, _ in results), sum(rss for _, _, rss in results)
+
+
+def summarize(
+    samples: List[Tuple[float, bool]],
+    wall_s: float,
+    peak_threads: int,
+    peak_rss_mb: float,
+    calls: Dict[str, int]
+) -> Dict[str, Any]:
+    latencies = [latency for latency, _ in samples]
+    commentaries = max(1, len(samples))
+    return {
+        "commentaries": len(samples),
+        "wall_s": round(wall_s, 3),
+        "throughput_per_s": round(len(samples) / wall_s, 3) if wall_s else 0.0,
+        "latency_p50_s": round(percentile(latencies, 50), 3),
+        "latency_p95_s": round(percentile(latencies, 95), 3),
+        "latency_p99_s": round(percentile(latencies, 99), 3),
+        "peak_rss_mb": round(peak_rss_mb, 1),
+        "peak_threads": peak_threads,
+        "upstream_calls_per_commentary": round(sum(calls.values()) / commentaries, 2),
+        "upstream_calls_by_service": {name: round(count / commentaries, 2) for name, count in calls.items()},
+        "degraded_ratio": round(sum(1 for _, degraded in samples if degraded) / commentaries, 3),
+    }
+
+
+def compare(report: Dict[str, Any], baseline: Dict[str, Any], tolerance: float) -> List[str]:
+    """Human-readable regressions of ``report`` against ``baseline``"""
+    regressions = []
+    for metric, (higher_is_worse, slack) in GATED_METRICS.items():
+        if metric not in baseline or metric not in report:
+            continue
+        current, reference = report[metric], baseline[metric]
+        if higher_is_worse:
+            limit = reference * (1 + tolerance) + slack
+            failed = current > limit
+        else:
+            limit = reference * (1 - tolerance) - slack
+            failed = current < limit
+        if failed:
+            regressions.append(f"{metric}: {current} vs baseline {reference} (limit {round(limit, 3)})")
+    return regressions
+
+
+def parse_args(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description="Concurrent-session load test for Top Bantz commentary")
+    parser.add_argument("--mode", choices=["flow", "streamlit"], default="flow")
+    parser.add_argument("--sessions", type=int, default=10, help="Concurrent simulated users")
+    parser.add_argument("--clicks", type=int, default=3, help="Player clicks per session")
+    parser.add_argument("--think-ms", type=float, default=0, help="Pause between a session's clicks")
+    parser.add_argument("--openai-latency-ms", type=float, default=300)
+    parser.add_argument("--tavily-latency-ms", type=float, default=200)
+    parser.add_argument("--football-latency-ms", type=float, default=100)
+    parser.add_argument("--jitter-ms", type=float, default=50)
+    parser.add_argument("--tail-ratio", type=float, default=0.0, help="Share of upstream calls that hit the slow tail")
+    parser.add_argument("--tail-ms", type=float, default=0.0, help="Extra latency for slow-tail calls")
+    parser.add_argument("--timeout", type=float, default=60, help="Per-run timeout in streamlit mode")
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE)
+    parser.add_argument("--save-baseline", action="store_true", help="Record this run as the new baseline")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="Allowed relative regression")
+    parser.add_argument("--output", type=Path, help="Also write the report JSON here")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = parse_args(argv)
+    os.chdir(ROOT)
+    upstreams = start_upstreams(args)
+    players = load_players()
+
+    start = time.perf_counter()
+    if args.mode == "flow":
+        with ResourceSampler() as sampler:
+            samples = asyncio.run(run_flow_sessions(args, players))
+        peak_threads, peak_rss_mb = sampler.peak_threads, sampler.peak_rss_mb()
+    else:
+        samples, peak_threads, peak_rss_mb = run_streamlit_sessions(args, players, upstreams.urls)
+    wall_s = time.perf_counter() - start
+    calls = upstreams.calls()
+    upstreams.stop()
+
+    report = summarize(samples, wall_s, peak_threads, peak_rss_mb, calls)
+    report["config"] = {
+        key: getattr(args, key) for key in (
+            "mode", "sessions", "clicks", "think_ms", "openai_latency_ms", "tavily_latency_ms",
+            "football_latency_ms", "jitter_ms", "tail_ratio", "tail_ms", "seed"
+        )
+    }
+    print(json.dumps(report, indent=2))
+    if args.output:
+        args.output.write_text(json.dumps(report, indent=2))
+
+    if args.save_baseline:
+        args.baseline.write_text(json.dumps(report, indent=2) + "\n")
+        print(f"Saved baseline to {args.baseline}")
+        return 0
+
+    if not args.baseline.exists():
+        print(f"No baseline at {args.baseline}; run with --save-baseline to record one")
+        return 0
+
+    baseline = json.loads(args.baseline.read_text())
+    if baseline.get("config") != report["config"]:
+        # Numbers from another mode or load profile are not comparable
+        print(f"Baseline at {args.baseline} was recorded with a different configuration: {baseline.get('config')}")
+        print("Re-run with the same options, or record a new baseline with --save-baseline")
+        return 2
+    regressions = compare(report, baseline, args.tolerance)
+    for regression in regressions:
+        print(f"REGRESSION {regression}")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
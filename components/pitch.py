@@ -5,9 +5,17 @@ import json
 with open("data/formations.json") as f:
     FORMATIONS = json.load(f)
 
-def render_pitch():
-    formation = "4-3-3"
-    players = FORMATIONS[formation]
+EVENT_COLORS = {
+    "goal": "gold",
+    "card": "orange",
+    "subst": "deepskyblue",
+    "var": "violet"
+}
+
+def render_pitch(highlights=None, selectable=True, caption=None, players=None, selected_id=None):
+    highlights = highlights or {}
+    # Live mode passes the fixture's own lineup; otherwise show the sample 4-3-3
+    players = players or FORMATIONS["4-3-3"]
 
     fig = go.Figure()
     fig.update_layout(
@@ -25,14 +33,24 @@ def render_pitch():
             x=[player["x"]],
             y=[player["y"]],
             mode="markers+text",
-            marker=dict(size=20, color="white"),
+            marker=dict(
+                size=26 if player["id"] in highlights else 20,
+                color=EVENT_COLORS.get(highlights.get(player["id"], "").lower(), "white")
+            ),
             text=[player["name"]],
             textposition="bottom center",
             hoverinfo="text",
             name=player["name"]
         ))
 
+    if caption:
+        fig.add_annotation(x=50, y=95, text=caption, showarrow=False, font=dict(size=16, color="white"))
+
     st.plotly_chart(fig, use_container_width=True)
-    selected_name = st.selectbox("Select Player", [p["name"] for p in players])
+    if not selectable:
+        return None
+    # Nothing is picked until the user chooses; coming back to the pitch keeps the last pick
+    index = next((i for i, p in enumerate(players) if p["id"] == selected_id), None)
+    selected_name = st.selectbox("Select Player", [p["name"] for p in players], index=index, placeholder="Pick a player")
     selected_player = next((p for p in players if p["name"] == selected_name), None)
     return selected_player
\ No newline at end of file
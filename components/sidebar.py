@@ -3,3 +3,30 @@ import streamlit as st
 def show_sidebar(player_name, result):
     st.sidebar.title(f"\U0001F3C6 {player_name} Commentary")
     st.sidebar.markdown(result["commentary"])
+    if result.get("degraded"):
+        st.sidebar.caption("Quick take from the stats desk - full commentary is temporarily unavailable.")
+
+
+def show_live_feed(fixture_id, status, entries):
+    score = status.get("score") or {}
+    st.sidebar.title(f"\U0001F4E1 Live Bantz - Fixture {fixture_id}")
+    if status.get("status"):
+        st.sidebar.caption(
+            f"{status['status']} {status.get('elapsed') or 0}' | "
+            f"{score.get('home', 0)} - {score.get('away', 0)}"
+        )
+
+    for team in status.get("statistics") or []:
+        stats = {s["type"]: s["value"] for s in team.get("statistics", [])}
+        st.sidebar.markdown(
+            f"**{team['team']['name']}**: {stats.get('Ball Possession', '-')} possession, "
+            f"{stats.get('Total Shots', 0)} shots, {stats.get('Shots on Goal', 0)} on target"
+        )
+
+    if status.get("error"):
+        st.sidebar.error(f"{status['error']} - check the fixture ID and start again.")
+    elif not entries:
+        st.sidebar.markdown("Waiting for the first big moment...")
+    for entry in entries:
+        minute = f"{entry['minute']}+{entry['extra']}" if entry.get("extra") else entry["minute"]
+        st.sidebar.markdown(f"**{minute}'** {entry['commentary']}")
@@ -4,4 +4,67 @@ from dotenv import load_dotenv
 load_dotenv()
 
 API_FOOTBALL_KEY = os.getenv("API_FOOTBALL_KEY")
-OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
\ No newline at end of file
+OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
+API_FOOTBALL_BASE_URL = os.getenv("API_FOOTBALL_BASE_URL", "https://v3.football.api-sports.io")
+
+# Model routing: cheap, fast models for planning and tool stages, the best model for narration
+MODEL_ROUTES = {
+    "orchestrator": os.getenv("ORCHESTRATOR_MODEL", "gpt-4o-mini"),
+    "stat": os.getenv("STAT_MODEL", "gpt-4o-mini"),
+    "fact": os.getenv("FACT_MODEL", "gpt-4o-mini"),
+    "memory": os.getenv("MEMORY_MODEL", "gpt-4o-mini"),
+    # Only the commentary text itself goes to the narration model; the narration agent's own
+    # function-calling turns are routed to the cheaper planner model
+    "narration_planner": os.getenv("NARRATION_PLANNER_MODEL", "gpt-4o-mini"),
+    "narration": os.getenv("NARRATION_MODEL", "gpt-4o"),
+}
+
+# Hedged narration requests: fire a second request once the first is slower than p95
+NARRATION_HEDGE_ENABLED = os.getenv("NARRATION_HEDGE_ENABLED", "true").lower() == "true"
+NARRATION_HEDGE_DEFAULT_MS = float(os.getenv("NARRATION_HEDGE_DEFAULT_MS", "4000"))
+NARRATION_HEDGE_MIN_SAMPLES = int(os.getenv("NARRATION_HEDGE_MIN_SAMPLES", "20"))
+# At most this fraction of narration requests may hedge, so a slow upstream is not hit twice as hard
+NARRATION_HEDGE_BUDGET_RATIO = float(os.getenv("NARRATION_HEDGE_BUDGET_RATIO", "0.1"))
+NARRATION_HEDGE_BUDGET_BURST = float(os.getenv("NARRATION_HEDGE_BUDGET_BURST", "5"))
+
+# Live match mode: adaptive polling bounds and the event queue size (producer blocks when full)
+LIVE_POLL_MIN_S = float(os.getenv("LIVE_POLL_MIN_S", "15"))
+LIVE_POLL_MAX_S = float(os.getenv("LIVE_POLL_MAX_S", "60"))
+LIVE_QUEUE_SIZE = int(os.getenv("LIVE_QUEUE_SIZE", "20"))
+LIVE_UI_REFRESH_S = float(os.getenv("LIVE_UI_REFRESH_S", "5"))
+# Give up on a fixture ID after this many lookups that return nothing
+LIVE_FIXTURE_LOOKUP_ATTEMPTS = int(os.getenv("LIVE_FIXTURE_LOOKUP_ATTEMPTS", "3"))
+
+# Resilience: end-to-end deadline per click, per-upstream latency SLOs and circuit breaker tuning
+COMMENTARY_DEADLINE_S = float(os.getenv("COMMENTARY_DEADLINE_S", "15"))
+OPENAI_TIMEOUT_S = float(os.getenv("OPENAI_TIMEOUT_S", "10"))
+UPSTREAM_SLO_MS = {
+    "openai": float(os.getenv("OPENAI_SLO_MS", "8000")),
+    "tavily": float(os.getenv("TAVILY_SLO_MS", "3000")),
+    "api_football": float(os.getenv("API_FOOTBALL_SLO_MS", "2000")),
+}
+UPSTREAM_TIMEOUT_S = float(os.getenv("UPSTREAM_TIMEOUT_S", "5"))
+BREAKER_FAILURE_THRESHOLD = int(os.getenv("BREAKER_FAILURE_THRESHOLD", "5"))
+BREAKER_RESET_S = float(os.getenv("BREAKER_RESET_S", "30"))
+
+# Caches for stats, facts and fact memory; set CACHE_PATH to share them between processes via SQLite
+CACHE_PATH = os.getenv("CACHE_PATH")
+STAT_CACHE_TTL_S = float(os.getenv("STAT_CACHE_TTL_S", "21600"))
+FACT_CACHE_TTL_S = float(os.getenv("FACT_CACHE_TTL_S", "3600"))
+MEMORY_CACHE_TTL_S = float(os.getenv("MEMORY_CACHE_TTL_S", "86400"))
+
+# Headless commentary API: the UI calls it instead of running the agents when the URL is set
+COMMENTARY_API_URL = os.getenv("COMMENTARY_API_URL")
+# In-flight agent flows per process; also sizes the orchestrator thread pool so admitted flows never queue
+SERVER_MAX_CONCURRENCY = int(os.getenv("SERVER_MAX_CONCURRENCY", "16"))
+
+# Speculative pre-generation of commentary for the likely next selections
+PREFETCH_ENABLED = os.getenv("PREFETCH_ENABLED", "true").lower() == "true"
+PREFETCH_TOP_K = int(os.getenv("PREFETCH_TOP_K", "2"))
+PREFETCH_MAX_CONCURRENT = int(os.getenv("PREFETCH_MAX_CONCURRENT", "2"))
+PREFETCH_MAX_JOBS_PER_WINDOW = int(os.getenv("PREFETCH_MAX_JOBS_PER_WINDOW", "6"))
+PREFETCH_WINDOW_S = float(os.getenv("PREFETCH_WINDOW_S", "60"))
+PREFETCH_IDLE_DELAY_S = float(os.getenv("PREFETCH_IDLE_DELAY_S", "1.0"))
+PREFETCH_POPULARITY_WEIGHT = float(os.getenv("PREFETCH_POPULARITY_WEIGHT", "0.5"))
+PREFETCH_POPULARITY_HALF_LIFE_S = float(os.getenv("PREFETCH_POPULARITY_HALF_LIFE_S", "900"))
+COMMENTARY_CACHE_TTL_S = float(os.getenv("COMMENTARY_CACHE_TTL_S", "600"))
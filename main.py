@@ -1,17 +1,88 @@
 import streamlit as st
 from components.pitch import render_pitch
-from components.sidebar import show_sidebar
-from orchestration.flow import run_agent_flow
+from components.sidebar import show_sidebar, show_live_feed
+from config import COMMENTARY_API_URL, LIVE_UI_REFRESH_S, PREFETCH_ENABLED
+from orchestration.fallback import fallback_commentary
 import asyncio
+import time
+import uuid
+
+# With a commentary API configured the UI stays thin and leaves the agents to the server
+if COMMENTARY_API_URL:
+    from services.commentary_client import get_commentary
+elif PREFETCH_ENABLED:
+    from orchestration.prefetch import get_background_prefetcher
+else:
+    from orchestration.flow import run_agent_flow
 
 st.set_page_config(page_title="Top Bantz AI Commentary", layout="wide")
 
 st.title("\U000026BD Top Bantz AI Commentary")
 
-selected_player = render_pitch()
+mode = st.radio("Mode", ["Season stats", "Live match"], horizontal=True)
+
+if mode == "Season stats":
+    # Leaving live mode stops polling the fixture in the background
+    if st.session_state.get("live_session"):
+        st.session_state.pop("live_session").stop()
+
+    selected_player = render_pitch(selected_id=st.session_state.get("commentary_player_id"))
+    # Scopes speculative prefetching to this browser session
+    session_id = st.session_state.setdefault("session_id", uuid.uuid4().hex)
+
+    # Every widget interaction reruns the script; only a new selection counts as a pick
+    if selected_player and selected_player["id"] != st.session_state.get("commentary_player_id"):
+        if COMMENTARY_API_URL:
+            result = get_commentary(selected_player["id"], selected_player["name"], session_id)
+        elif PREFETCH_ENABLED:
+            # Shared across sessions, so likely next picks are generated while the user reads
+            result = get_background_prefetcher().get_commentary(selected_player["id"], selected_player["name"], session_id)
+        else:
+            # Await the async function properly using asyncio.run
+            result = asyncio.run(run_agent_flow(selected_player["id"], selected_player["name"]))
+        # The API can be unreachable; never leave a pick without any commentary
+        if not (result and result.get("commentary")):
+            result = fallback_commentary(selected_player["id"], selected_player["name"])
+        st.session_state.commentary_player_id = selected_player["id"]
+        st.session_state.commentary = (selected_player["name"], result)
 
-if selected_player:
-    # Await the async function properly using asyncio.run
-    result = asyncio.run(run_agent_flow(selected_player["id"], selected_player["name"]))
+    player_name, result = st.session_state.get("commentary", (None, None))
     if result:
-        show_sidebar(selected_player["name"], result)
+        show_sidebar(player_name, result)
+else:
+    from orchestration.live import LiveMatchSession
+
+    fixture_id = st.text_input("Fixture ID", value=st.session_state.get("live_fixture_id", ""))
+    live_session = st.session_state.get("live_session")
+
+    start_col, stop_col = st.columns(2)
+    if start_col.button("Start live bantz", disabled=not fixture_id):
+        if live_session:
+            live_session.stop()
+        live_session = LiveMatchSession(fixture_id)
+        live_session.start()
+        st.session_state.live_session = live_session
+        st.session_state.live_fixture_id = fixture_id
+    if stop_col.button("Stop", disabled=live_session is None) and live_session:
+        live_session.stop()
+
+    if live_session:
+        status = live_session.status
+        score = status["score"]
+        caption = None
+        if status["status"]:
+            caption = f"{status['status']} {status['elapsed'] or 0}' | {score.get('home', 0)} - {score.get('away', 0)}"
+        render_pitch(
+            highlights=live_session.highlighted_players(),
+            selectable=False,
+            caption=caption,
+            players=live_session.pitch_players()
+        )
+        show_live_feed(live_session.fixture_id, status, live_session.entries())
+
+        # Keep the pitch and feed fresh while the match is being followed
+        if live_session.running:
+            time.sleep(LIVE_UI_REFRESH_S)
+            st.rerun()
+    else:
+        render_pitch(selectable=False)
@@ -0,0 +1,74 @@
+import random
+import re
+from typing import Any, Dict, Optional
+
+from services.cache import fact_cache
+from services.football_api import get_cached_stat
+
+
+STAT_TEMPLATES = [
+    "{name} steps up! {goals} goals and {assists} assists in {appearances} appearances - numbers that do the talking!",
+    "What a season from {name}: {goals} goals, {assists} assists and {minutes} minutes of pure graft!",
+    "They'll be singing about {name} - {goals} goals and {assists} assists from {appearances} games!",
+]
+
+FACT_TEMPLATES = [
+    "And here's one for the pub quiz: {fact}",
+    "Did you know? {fact}",
+    "Word around the ground: {fact}",
+]
+
+NO_DATA_TEMPLATES = [
+    "{name} is on the ball! The stats desk is catching its breath, but you can feel the crowd rising!",
+    "All eyes on {name} - no numbers to hand right now, but what a player to have on the pitch!",
+]
+
+
+def _first_sentences(text: str, limit: int = 280) -> str:
+    """Trim a cached fact to whole sentences within ``limit`` characters"""
+    text = " ".join(text.split())
+    if len(text) <= limit:
+        return text
+    sentences = re.split(r"(?<=[.!?])\s+", text)
+    trimmed = ""
+    for sentence in sentences:
+        if len(trimmed) + len(sentence) + 1 > limit:
+            break
+        trimmed = f"{trimmed} {sentence}".strip()
+    return trimmed or text[:limit].rstrip() + "..."
+
+
+def template_commentary(player_name: str, stat: Optional[Dict[str, Any]], fact: Optional[str]) -> str:
+    """Fill commentary templates from whatever stats and facts are at hand, without an LLM"""
+    if stat:
+        values = {key: 0 if value is None else value for key, value in stat.items()}
+        line = random.choice(STAT_TEMPLATES).format(**{**values, "name": player_name})
+    else:
+        line = random.choice(NO_DATA_TEMPLATES).format(name=player_name)
+    if fact:
+        line += " " + random.choice(FACT_TEMPLATES).format(fact=_first_sentences(fact))
+    return line
+
+
+def fallback_commentary(player_id: str, player_name: str) -> Dict[str, Any]:
+    """Degraded commentary built only from cached stats and facts"""
+    stat = get_cached_stat(player_id)
+    fact = fact_cache.get(player_name, allow_stale=True)
+    return {
+        "commentary": template_commentary(player_name, stat, fact),
+        "degraded": True
+    }
+
+
+LIVE_EVENT_TEMPLATES = {
+    "goal": "GOAL! {player} finds the net for {team} on {minute}'!",
+    "card": "{detail} for {player} ({team}) on {minute}' - the referee has seen enough!",
+    "subst": "Change for {team} on {minute}': {assist} comes on for {player}.",
+    "var": "VAR check on {minute}': {detail}.",
+}
+
+
+def live_event_template(event: Dict[str, Any]) -> str:
+    """Template line for a live event when the narration model is unavailable"""
+    template = LIVE_EVENT_TEMPLATES.get((event.get("type") or "").lower(), "{detail} on {minute}'.")
+    return template.format(**{key: event.get(key) or "" for key in ("player", "team", "minute", "detail", "assist")})
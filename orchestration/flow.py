@@ -1,31 +1,77 @@
 from langchain.agents import AgentExecutor, create_openai_functions_agent
 from langchain.prompts import ChatPromptTemplate, MessagesPlaceholder
 from langchain_openai import ChatOpenAI
+from langchain_core.callbacks import BaseCallbackHandler
 from langchain_core.runnables import RunnablePassthrough
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
 import asyncio
 from concurrent.futures import ThreadPoolExecutor
 import re
+import threading
 
 from agents.stat_agent import StatAgent
 from agents.fact_agent import FactAgent
 from agents.narration_agent import NarrationAgent
 from agents.memory_agent import MemoryAgent
-from config import OPENAI_API_KEY
+from config import COMMENTARY_DEADLINE_S, SERVER_MAX_CONCURRENCY, PREFETCH_MAX_CONCURRENT
+from orchestration.fallback import fallback_commentary
+from services.model_router import get_llm
+from services.resilience import get_breaker
+
+# Shared so a timed-out orchestrator run never blocks the caller while it winds down. Sized to the
+# admission cap so an admitted flow never spends its deadline waiting for a thread; speculative
+# runs get their own pool so they can never delay a real request.
+_orchestrator_pool = ThreadPoolExecutor(max_workers=SERVER_MAX_CONCURRENCY, thread_name_prefix="orchestrator")
+_speculation_pool = ThreadPoolExecutor(max_workers=PREFETCH_MAX_CONCURRENT, thread_name_prefix="speculation")
+
+
+class FlowCancelled(Exception):
+    """Raised inside the orchestrator thread once nobody is waiting for the run any more"""
+
+
+class CancellationCallback(BaseCallbackHandler):
+    """Stops an orchestrator run at its next model call or tool call once any event is set"""
+
+    raise_error: bool = True
+
+    def __init__(self, *events: threading.Event):
+        self.events = events
+
+    def _check(self) -> None:
+        if any(event.is_set() for event in self.events):
+            raise FlowCancelled()
+
+    def on_chat_model_start(self, *args, **kwargs) -> None:
+        self._check()
+
+    def on_llm_start(self, *args, **kwargs) -> None:
+        self._check()
+
+    def on_tool_start(self, *args, **kwargs) -> None:
+        self._check()
+
+
+class DeferredMemoryCallback(BaseCallbackHandler):
+    """Collects the facts a speculative run would have stored, so they can be stored once it is served"""
+
+    def __init__(self):
+        self.facts: List[Dict[str, str]] = []
+
+    def on_tool_start(self, serialized: Dict[str, Any], input_str: str, inputs: Optional[Dict[str, Any]] = None, **kwargs) -> None:
+        if (serialized or {}).get("name") != "memory_agent" or not isinstance(inputs, dict):
+            return
+        if inputs.get("action") == "store" and inputs.get("player_name") and inputs.get("fact"):
+            self.facts.append({"player_name": inputs["player_name"], "fact": inputs["fact"]})
 
 
 class MultiAgentOrchestrator:
     def __init__(self):
-        self.llm = ChatOpenAI(
-            model="gpt-4o",
-            temperature=0.7,
-            openai_api_key=OPENAI_API_KEY
-        )
+        self.llm = get_llm("orchestrator")
 
-        self.stat_agent = StatAgent(self.llm)
-        self.fact_agent = FactAgent(self.llm)
-        self.narration_agent = NarrationAgent(self.llm)
-        self.memory_agent = MemoryAgent()
+        self.stat_agent = StatAgent(get_llm("stat"))
+        self.fact_agent = FactAgent(get_llm("fact"))
+        self.narration_agent = NarrationAgent(get_llm("narration_planner"))
+        self.memory_agent = MemoryAgent(get_llm("memory"))
 
         self.orchestrator = self._create_orchestrator()
 
@@ -60,29 +106,78 @@ Return a full final commentary paragraph.
         ])
 
         agent = create_openai_functions_agent(self.llm, tools, prompt)
-        return AgentExecutor(agent=agent, tools=tools, verbose=True, max_iterations=10)
+        return AgentExecutor(
+            agent=agent,
+            tools=tools,
+            verbose=True,
+            max_iterations=10,
+            max_execution_time=COMMENTARY_DEADLINE_S
+        )
 
-    async def run_agent_flow(self, player_id: str, player_name: str) -> Optional[Dict[str, Any]]:
+    async def run_agent_flow(
+        self,
+        player_id: str,
+        player_name: str,
+        deadline: float = COMMENTARY_DEADLINE_S,
+        cancel_event: Optional[threading.Event] = None,
+        speculative: bool = False
+    ) -> Optional[Dict[str, Any]]:
+        """Commentary for a player; None only if ``cancel_event`` was set mid-run.
+
+        ``speculative`` runs are for prefetching: they use their own thread pool and do
+        not write to fact memory. The facts they would have stored are returned under
+        ``pending_facts`` for the caller to store once the commentary is shown.
+        """
+        # Skip the agent chain entirely while OpenAI is known to be down
+        if get_breaker("openai").is_open():
+            return fallback_commentary(player_id, player_name)
+
+        # Set once this call returns, so a run that outlived its caller stops spending upstream calls
+        finished = threading.Event()
+        stop_events = [finished] + ([cancel_event] if cancel_event else [])
+        deferred_memory = DeferredMemoryCallback() if speculative else None
         try:
             input_data = {
                 "input": f"Create football commentary for player {player_name} (ID: {player_id}). "
                          f"Follow the workflow: get stats, check if valid, get facts, check memory for duplicates, "
                          f"generate commentary, and store fact in memory. Return only the final combined commentary."
             }
-            result = await self._run_orchestrator_async(input_data)
-            return self._parse_result(result)
+            result = await asyncio.wait_for(
+                self._run_orchestrator_async(input_data, stop_events, deferred_memory),
+                timeout=deadline
+            )
+            parsed = self._parse_result(result)
+            if parsed and parsed["commentary"] and not parsed["commentary"].startswith("Agent stopped"):
+                if deferred_memory:
+                    parsed["pending_facts"] = deferred_memory.facts
+                return parsed
+        except asyncio.TimeoutError:
+            print(f"Agent flow for {player_name} missed its {deadline}s deadline")
+        except FlowCancelled:
+            return None
         except Exception as e:
             print(f"Error in agent flow: {e}")
-            return None
-
-    async def _run_orchestrator_async(self, input_data: Dict[str, Any]) -> str:
-        loop = asyncio.get_event_loop()
-        with ThreadPoolExecutor() as executor:
-            result = await loop.run_in_executor(
-                executor,
-                self.orchestrator.invoke,
-                input_data
+        finally:
+            finished.set()
+        return fallback_commentary(player_id, player_name)
+
+    async def _run_orchestrator_async(
+        self,
+        input_data: Dict[str, Any],
+        stop_events: List[threading.Event],
+        deferred_memory: Optional[DeferredMemoryCallback] = None
+    ) -> str:
+        callbacks: List[BaseCallbackHandler] = [CancellationCallback(*stop_events)]
+        if deferred_memory:
+            callbacks.append(deferred_memory)
+        loop = asyncio.get_running_loop()
+        result = await loop.run_in_executor(
+            _speculation_pool if deferred_memory else _orchestrator_pool,
+            lambda: self.orchestrator.invoke(
+                input_data,
+                config={"callbacks": callbacks, "metadata": {"defer_memory_writes": deferred_memory is not None}}
             )
+        )
         return result["output"]
 
     def _parse_result(self, result: str) -> Optional[Dict[str, Any]]:
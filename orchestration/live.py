@@ -0,0 +1,124 @@
+import asyncio
+import threading
+from collections import deque
+from typing import Any, Callable, Deque, Dict, List, Optional
+
+from agents.narration_agent import live_event_commentary
+from config import LIVE_QUEUE_SIZE
+from orchestration.fallback import live_event_template
+from services.live_match import LiveMatchPoller
+from services.resilience import get_breaker
+
+
+def narrate_live_event(event: Dict[str, Any]) -> str:
+    """LLM commentary for a live event, falling back to a template when OpenAI is unavailable"""
+    if get_breaker("openai").is_open():
+        return live_event_template(event)
+    commentary = live_event_commentary(event)
+    if commentary.startswith("Error generating live commentary"):
+        return live_event_template(event)
+    return commentary
+
+
+class LiveCommentaryPipeline:
+    """Poller -> bounded queue -> narration, for a single fixture"""
+
+    def __init__(
+        self,
+        fixture_id: str,
+        on_commentary: Callable[[Dict[str, Any]], None],
+        queue_size: int = LIVE_QUEUE_SIZE,
+        narrate: Callable[[Dict[str, Any]], str] = narrate_live_event
+    ):
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+        self.poller = LiveMatchPoller(fixture_id, self.queue)
+        self.on_commentary = on_commentary
+        self.narrate = narrate
+
+    async def _narrate_events(self) -> None:
+        while True:
+            event = await self.queue.get()
+            try:
+                if event is None:
+                    return
+                commentary = await asyncio.to_thread(self.narrate, event)
+                self.on_commentary({**event, "commentary": commentary})
+            except Exception as e:
+                print(f"Error narrating live event: {e}")
+            finally:
+                self.queue.task_done()
+
+    async def run(self) -> None:
+        await asyncio.gather(self.poller.run(), self._narrate_events())
+
+
+class LiveMatchSession:
+    """Runs a live pipeline on a background thread so Streamlit reruns can read its feed"""
+
+    def __init__(self, fixture_id: str, max_entries: int = 50):
+        self.fixture_id = fixture_id
+        self._feed: Deque[Dict[str, Any]] = deque(maxlen=max_entries)
+        self._lock = threading.Lock()
+        self.pipeline = LiveCommentaryPipeline(fixture_id, self._add_entry)
+        self._thread: Optional[threading.Thread] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._task: Optional[asyncio.Task] = None
+
+    def _add_entry(self, entry: Dict[str, Any]) -> None:
+        with self._lock:
+            self._feed.appendleft(entry)
+
+    def _run(self) -> None:
+        self._loop = asyncio.new_event_loop()
+        try:
+            self._task = self._loop.create_task(self.pipeline.run())
+            self._loop.run_until_complete(self._task)
+        except asyncio.CancelledError:
+            pass
+        except Exception as e:
+            print(f"Error in live match session {self.fixture_id}: {e}")
+        finally:
+            self._loop.close()
+
+    def start(self) -> None:
+        if self.running:
+            return
+        self._thread = threading.Thread(target=self._run, name=f"live-{self.fixture_id}", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self.pipeline.poller.stop()
+        if self._loop and self._task and not self._loop.is_closed():
+            self._loop.call_soon_threadsafe(self._task.cancel)
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    @property
+    def status(self) -> Dict[str, Any]:
+        poller = self.pipeline.poller
+        return {
+            "status": poller.status,
+            "elapsed": poller.elapsed,
+            "score": dict(poller.score),
+            "statistics": list(poller.statistics),
+            "error": poller.error,
+        }
+
+    def pitch_players(self) -> Optional[List[Dict[str, Any]]]:
+        """The fixture's players on the pitch, or None until the lineups are announced"""
+        return [dict(player) for player in self.pipeline.poller.lineup] or None
+
+    def entries(self) -> List[Dict[str, Any]]:
+        """Commentary entries, newest first"""
+        with self._lock:
+            return list(self._feed)
+
+    def highlighted_players(self, limit: int = 3) -> Dict[int, str]:
+        """Player IDs involved in the most recent events, mapped to the event type"""
+        highlights: Dict[int, str] = {}
+        for entry in self.entries()[:limit]:
+            if entry.get("player_id") is not None:
+                highlights.setdefault(entry["player_id"], entry.get("type") or "")
+        return highlights
@@ -0,0 +1,271 @@
+import asyncio
+import json
+import math
+import threading
+import time
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional, Set
+
+from config import (
+    COMMENTARY_DEADLINE_S,
+    PREFETCH_ENABLED,
+    PREFETCH_TOP_K,
+    PREFETCH_MAX_CONCURRENT,
+    PREFETCH_MAX_JOBS_PER_WINDOW,
+    PREFETCH_WINDOW_S,
+    PREFETCH_IDLE_DELAY_S,
+    PREFETCH_POPULARITY_WEIGHT,
+    PREFETCH_POPULARITY_HALF_LIFE_S,
+)
+from agents.memory_agent import record_fact
+from orchestration.flow import MultiAgentOrchestrator
+from services.cache import commentary_cache
+from services.resilience import get_breaker
+
+
+def load_formation(formation: str = "4-3-3", path: str = "data/formations.json") -> List[Dict[str, Any]]:
+    with open(path) as f:
+        return json.load(f)[formation]
+
+
+class PopularityTracker:
+    """Exponentially decayed selection counts, so recent picks weigh the most"""
+
+    def __init__(self, half_life_s: float = PREFETCH_POPULARITY_HALF_LIFE_S):
+        self.half_life_s = half_life_s
+        self._scores: Dict[str, tuple] = {}
+        self._lock = threading.Lock()
+
+    def _decayed(self, score: float, updated_at: float, now: float) -> float:
+        return score * 0.5 ** ((now - updated_at) / self.half_life_s)
+
+    def record(self, player_id: str) -> None:
+        now = time.monotonic()
+        with self._lock:
+            score, updated_at = self._scores.get(player_id, (0.0, now))
+            self._scores[player_id] = (self._decayed(score, updated_at, now) + 1, now)
+
+    def score(self, player_id: str) -> float:
+        now = time.monotonic()
+        with self._lock:
+            score, updated_at = self._scores.get(player_id, (0.0, now))
+        return self._decayed(score, updated_at, now)
+
+
+class Speculation:
+    """One in-flight speculative run, kept alive while any session still wants it"""
+
+    def __init__(self, task: asyncio.Task, cancel_event: threading.Event, session_id: str):
+        self.task = task
+        self.cancel_event = cancel_event
+        self.sessions: Set[str] = {session_id}
+
+    def release(self, session_id: str) -> None:
+        self.sessions.discard(session_id)
+        if not self.sessions:
+            self.cancel_event.set()
+            self.task.cancel()
+
+
+class SpeculativePrefetcher:
+    """Pre-generates commentary for the players most likely to be picked next.
+
+    After each real request, and once that session has been idle for ``idle_delay``
+    seconds, the top candidates - ranked by recent popularity and distance on the
+    pitch from the player just picked - are generated and parked in the commentary
+    cache. Speculation is capped both in concurrent jobs and in jobs per rolling
+    window, skipped while OpenAI's circuit is open, and cancelled when the same
+    session makes its next pick (unless it is for the very player being speculated
+    on). Popularity and the budget are shared; speculation is tracked per session,
+    so one user's pick never cancels the runs made for another user.
+    """
+
+    def __init__(
+        self,
+        orchestrator: Optional[MultiAgentOrchestrator] = None,
+        players: Optional[List[Dict[str, Any]]] = None,
+        top_k: int = PREFETCH_TOP_K,
+        max_concurrent: int = PREFETCH_MAX_CONCURRENT,
+        max_jobs_per_window: int = PREFETCH_MAX_JOBS_PER_WINDOW,
+        window_s: float = PREFETCH_WINDOW_S,
+        idle_delay: float = PREFETCH_IDLE_DELAY_S,
+        popularity_weight: float = PREFETCH_POPULARITY_WEIGHT,
+        enabled: bool = PREFETCH_ENABLED
+    ):
+        self.orchestrator = orchestrator or MultiAgentOrchestrator()
+        self.players = {str(p["id"]): p for p in (players or load_formation())}
+        self.top_k = top_k
+        self.max_concurrent = max_concurrent
+        self.max_jobs_per_window = max_jobs_per_window
+        self.window_s = window_s
+        self.idle_delay = idle_delay
+        self.popularity_weight = popularity_weight
+        self.enabled = enabled
+        self.popularity = PopularityTracker()
+        self._started: Deque[float] = deque()
+        self._in_flight: Dict[str, Speculation] = {}
+        self._schedulers: Dict[str, asyncio.Task] = {}
+
+    def rank_candidates(self, current_id: str) -> List[Dict[str, Any]]:
+        """Other players ordered by blended popularity and pitch adjacency"""
+        current = self.players.get(str(current_id))
+        others = [p for pid, p in self.players.items() if pid != str(current_id)]
+        if not current or not others:
+            return others
+
+        distances = {str(p["id"]): math.dist((p["x"], p["y"]), (current["x"], current["y"])) for p in others}
+        max_distance = max(distances.values()) or 1.0
+        popularity = {str(p["id"]): self.popularity.score(str(p["id"])) for p in others}
+        max_popularity = max(popularity.values()) or 1.0
+
+        def score(player: Dict[str, Any]) -> float:
+            pid = str(player["id"])
+            adjacency = 1 - distances[pid] / max_distance
+            return self.popularity_weight * popularity[pid] / max_popularity + (1 - self.popularity_weight) * adjacency
+
+        return sorted(others, key=score, reverse=True)
+
+    def _take_budget(self) -> bool:
+        now = time.monotonic()
+        while self._started and now - self._started[0] > self.window_s:
+            self._started.popleft()
+        if len(self._started) >= self.max_jobs_per_window or len(self._in_flight) >= self.max_concurrent:
+            return False
+        self._started.append(now)
+        return True
+
+    def cancel_speculation(self, session_id: str, keep: Optional[str] = None) -> None:
+        """Drop a session's pending and in-flight speculation; runs other sessions still want carry on"""
+        scheduler = self._schedulers.pop(session_id, None)
+        if scheduler:
+            scheduler.cancel()
+        for player_id, speculation in list(self._in_flight.items()):
+            if player_id != keep and session_id in speculation.sessions:
+                speculation.release(session_id)
+
+    async def get_commentary(
+        self,
+        player_id: str,
+        player_name: str,
+        session_id: Optional[str] = None,
+        deadline: float = COMMENTARY_DEADLINE_S
+    ) -> Optional[Dict[str, Any]]:
+        """Serve a real request: prefetched result if there is one, otherwise run the flow.
+
+        Only requests with a ``session_id`` cancel or start speculation. A request that
+        waits on an in-flight speculation takes its answer even when degraded, and if the
+        speculation was cancelled the real run only gets what is left of the deadline.
+        """
+        player_id = str(player_id)
+        if session_id is not None:
+            self.cancel_speculation(session_id, keep=player_id)
+        self.popularity.record(player_id)
+
+        result = commentary_cache.pop(player_id)
+        speculation = self._in_flight.get(player_id)
+        if result is None and speculation:
+            # Already being generated speculatively: the head start is worth keeping.
+            # wait() rather than await, so a later cancellation falls through to a real run
+            if session_id is not None:
+                speculation.sessions.add(session_id)
+            started = time.monotonic()
+            await asyncio.wait([speculation.task])
+            deadline = max(deadline - (time.monotonic() - started), 0)
+            # Degraded answers are not cached, but this request has already waited for one
+            result = commentary_cache.pop(player_id) or (
+                None if speculation.task.cancelled() else speculation.task.result()
+            )
+        if result is not None:
+            # The fact is only "shown" now, so only now does it count towards repetition
+            for pending in result.pop("pending_facts", []):
+                record_fact(pending["player_name"], pending["fact"])
+            result = {**result, "prefetched": True}
+        else:
+            result = await self.orchestrator.run_agent_flow(player_id, player_name, deadline=deadline)
+
+        if session_id is not None and self.enabled:
+            self._schedule(session_id, player_id)
+        return result
+
+    def _schedule(self, session_id: str, current_id: str) -> None:
+        # A newer pick from the same session supersedes any speculation still waiting to start
+        previous = self._schedulers.pop(session_id, None)
+        if previous:
+            previous.cancel()
+        scheduler = asyncio.ensure_future(self._speculate_after_idle(session_id, current_id))
+        self._schedulers[session_id] = scheduler
+        scheduler.add_done_callback(
+            lambda task: self._schedulers.pop(session_id, None) if self._schedulers.get(session_id) is task else None
+        )
+
+    async def _speculate_after_idle(self, session_id: str, current_id: str) -> None:
+        await asyncio.sleep(self.idle_delay)
+        for player in self.rank_candidates(current_id)[:self.top_k]:
+            player_id = str(player["id"])
+            if player_id in self._in_flight:
+                self._in_flight[player_id].sessions.add(session_id)
+                continue
+            if commentary_cache.get(player_id) is not None:
+                continue
+            if get_breaker("openai").is_open() or not self._take_budget():
+                break
+            cancel_event = threading.Event()
+            task = asyncio.ensure_future(self._speculate(player_id, player["name"], cancel_event))
+            self._in_flight[player_id] = Speculation(task, cancel_event, session_id)
+            task.add_done_callback(lambda done, pid=player_id: self._finish(pid, done))
+
+    def _finish(self, player_id: str, task: asyncio.Task) -> None:
+        speculation = self._in_flight.get(player_id)
+        if speculation and speculation.task is task:
+            del self._in_flight[player_id]
+
+    async def _speculate(
+        self,
+        player_id: str,
+        player_name: str,
+        cancel_event: threading.Event
+    ) -> Optional[Dict[str, Any]]:
+        try:
+            result = await self.orchestrator.run_agent_flow(
+                player_id, player_name, cancel_event=cancel_event, speculative=True
+            )
+        except Exception as e:
+            print(f"Error prefetching commentary for {player_name}: {e}")
+            return None
+        # Degraded template answers are cheap to rebuild and should not displace a real one
+        if result and not result.get("degraded") and not cancel_event.is_set():
+            commentary_cache.set(player_id, result)
+        return result
+
+
+class BackgroundPrefetcher:
+    """Runs a prefetcher on a long-lived event loop thread for callers without one (Streamlit)"""
+
+    def __init__(self, prefetcher: Optional[SpeculativePrefetcher] = None):
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, name="prefetcher", daemon=True)
+        self._thread.start()
+        self.prefetcher = prefetcher or self._call(self._create)
+
+    @staticmethod
+    async def _create() -> SpeculativePrefetcher:
+        return SpeculativePrefetcher()
+
+    def _call(self, factory):
+        return asyncio.run_coroutine_threadsafe(factory(), self._loop).result()
+
+    def get_commentary(self, player_id: str, player_name: str, session_id: str) -> Optional[Dict[str, Any]]:
+        return self._call(lambda: self.prefetcher.get_commentary(player_id, player_name, session_id))
+
+
+_background: Optional[BackgroundPrefetcher] = None
+_background_lock = threading.Lock()
+
+
+def get_background_prefetcher() -> BackgroundPrefetcher:
+    """Process-wide prefetcher shared by every Streamlit session"""
+    global _background
+    with _background_lock:
+        if _background is None:
+            _background = BackgroundPrefetcher()
+        return _background
@@ -0,0 +1,329 @@
+"""Headless asyncio HTTP service for the commentary flow.
+
+    python -m server.app --workers 4 --port 8000
+
+Endpoints:
+    GET  /health
+    POST /commentary          {"player_id": "874", "player_name": "Cristiano Ronaldo", "session_id": "optional"}
+    POST /commentary/batch    {"players": [{"player_id": ..., "player_name": ...}, ...]}
+    GET  /commentary/stream?player_id=874&player_name=Cristiano%20Ronaldo    (Server-Sent Events)
+    POST /commentary/stream   {"players": [...]}    (one SSE event per player as each finishes)
+
+Workers are forked processes accepting on one shared listening socket. They share
+the stats, fact and memory caches through a SQLite file (``CACHE_PATH``).
+"""
+import argparse
+import asyncio
+import json
+import multiprocessing
+import os
+import socket
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlparse
+
+
+MAX_HEADER_BYTES = 16 * 1024
+MAX_BODY_BYTES = 1024 * 1024
+MAX_BATCH_SIZE = 50
+
+REASONS = {
+    200: "OK",
+    400: "Bad Request",
+    404: "Not Found",
+    405: "Method Not Allowed",
+    411: "Length Required",
+    413: "Payload Too Large",
+    431: "Request Header Fields Too Large",
+    500: "Internal Server Error",
+}
+
+
+class HTTPError(Exception):
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+        self.message = message
+
+
+class Request:
+    def __init__(self, method: str, target: str, version: str, headers: Dict[str, str], body: bytes):
+        url = urlparse(target)
+        self.method = method
+        self.path = url.path.rstrip("/") or "/"
+        self.query = {k: v[0] for k, v in parse_qs(url.query).items()}
+        self.version = version
+        self.headers = headers
+        self.body = body
+        self.client: Optional[str] = None
+
+    @property
+    def keep_alive(self) -> bool:
+        connection = self.headers.get("connection", "").lower()
+        if self.version == "HTTP/1.0":
+            return connection == "keep-alive"
+        return connection != "close"
+
+    def json(self) -> Any:
+        try:
+            return json.loads(self.body or b"{}")
+        except ValueError:
+            raise HTTPError(400, "Request body must be JSON")
+
+
+async def read_request(reader: asyncio.StreamReader) -> Optional[Request]:
+    """Parse one HTTP/1.x request, or return None when the client has closed the connection"""
+    try:
+        head = await reader.readuntil(b"\r\n\r\n")
+    except asyncio.IncompleteReadError:
+        return None
+    except asyncio.LimitOverrunError:
+        raise HTTPError(431, "Request headers too large")
+
+    lines = head.decode("latin-1").split("\r\n")
+    try:
+        method, target, version = lines[0].split(" ", 2)
+    except ValueError:
+        raise HTTPError(400, "Malformed request line")
+    headers = {}
+    for line in lines[1:]:
+        if ":" in line:
+            name, value = line.split(":", 1)
+            headers[name.strip().lower()] = value.strip()
+
+    # Chunked bodies are not supported; reading them as empty would desync the connection
+    if "transfer-encoding" in headers:
+        raise HTTPError(411, "Transfer-Encoding is not supported; send a Content-Length")
+    try:
+        length = int(headers.get("content-length") or 0)
+    except ValueError:
+        raise HTTPError(400, "Malformed Content-Length header")
+    if length < 0:
+        raise HTTPError(400, "Malformed Content-Length header")
+    if length > MAX_BODY_BYTES:
+        raise HTTPError(413, "Request body too large")
+    body = await reader.readexactly(length) if length else b""
+    return Request(method.upper(), target, version, headers, body)
+
+
+def encode_response(status: int, payload: Any, keep_alive: bool) -> bytes:
+    body = json.dumps(payload).encode()
+    head = (
+        f"HTTP/1.1 {status} {REASONS.get(status, '')}\r\n"
+        f"Content-Type: application/json\r\n"
+        f"Content-Length: {len(body)}\r\n"
+        f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n"
+    )
+    return head.encode() + body
+
+
+def encode_event(event: str, data: Any) -> bytes:
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n".encode()
+
+
+def parse_players(payload: Any) -> List[Tuple[str, str]]:
+    players = payload.get("players") if isinstance(payload, dict) else None
+    if not isinstance(players, list) or not players:
+        raise HTTPError(400, "Expected a non-empty 'players' list")
+    if len(players) > MAX_BATCH_SIZE:
+        raise HTTPError(400, f"At most {MAX_BATCH_SIZE} players per request")
+    return [parse_player(player) for player in players]
+
+
+def parse_player(payload: Any) -> Tuple[str, str]:
+    if not isinstance(payload, dict) or not payload.get("player_id") or not payload.get("player_name"):
+        raise HTTPError(400, "Each player needs 'player_id' and 'player_name'")
+    return str(payload["player_id"]), str(payload["player_name"])
+
+
+class CommentaryService:
+    """One orchestrator per worker, with a cap on in-flight agent flows.
+
+    Single-player requests speculate on behalf of their client session (the
+    ``session_id`` in the body, or the client's address); batch and stream requests
+    already name every player they want, so they do not speculate.
+
+    Waiting for a free slot counts against the commentary deadline: a request still
+    queued when it runs out gets template commentary instead.
+    """
+
+    def __init__(self, max_concurrency: int, prefetcher=None):
+        # Imported here so CACHE_PATH is in the environment before config.py is loaded
+        from config import COMMENTARY_DEADLINE_S
+        from orchestration.prefetch import SpeculativePrefetcher
+
+        self.prefetcher = prefetcher or SpeculativePrefetcher()
+        self.semaphore = asyncio.Semaphore(max_concurrency)
+        self.deadline = COMMENTARY_DEADLINE_S
+
+    async def commentary(self, player_id: str, player_name: str, session_id: Optional[str] = None) -> Dict[str, Any]:
+        from orchestration.fallback import fallback_commentary
+
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        try:
+            await asyncio.wait_for(self.semaphore.acquire(), self.deadline)
+        except asyncio.TimeoutError:
+            result = fallback_commentary(player_id, player_name)
+        else:
+            try:
+                remaining = max(self.deadline - (loop.time() - started), 0)
+                result = await self.prefetcher.get_commentary(player_id, player_name, session_id, deadline=remaining)
+            finally:
+                self.semaphore.release()
+        return {"player_id": player_id, "player_name": player_name, **(result or {"commentary": None})}
+
+    async def batch(self, players: List[Tuple[str, str]]) -> List[Dict[str, Any]]:
+        return list(await asyncio.gather(*(self.commentary(pid, name) for pid, name in players)))
+
+    async def stream(self, players: List[Tuple[str, str]]) -> AsyncIterator[Dict[str, Any]]:
+        """Yield results in completion order"""
+        tasks = [asyncio.ensure_future(self.commentary(pid, name)) for pid, name in players]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            for task in tasks:
+                task.cancel()
+
+
+class CommentaryServer:
+    def __init__(self, service: CommentaryService):
+        self.service = service
+
+    async def handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        peer = writer.get_extra_info("peername")
+        try:
+            while True:
+                try:
+                    request = await read_request(reader)
+                    if request is None:
+                        break
+                    request.client = peer[0] if peer else None
+                    if request.path == "/commentary/stream":
+                        await self.stream(request, writer)
+                        break
+                    status, payload = await self.route(request)
+                except HTTPError as e:
+                    writer.write(encode_response(e.status, {"error": e.message}, keep_alive=False))
+                    await writer.drain()
+                    break
+                except Exception as e:
+                    print(f"Error handling request: {e}")
+                    writer.write(encode_response(500, {"error": "Internal server error"}, keep_alive=False))
+                    await writer.drain()
+                    break
+
+                writer.write(encode_response(status, payload, request.keep_alive))
+                await writer.drain()
+                if not request.keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    async def route(self, request: Request) -> Tuple[int, Any]:
+        if request.path == "/health":
+            return 200, {"status": "ok", "pid": os.getpid()}
+        if request.path == "/commentary":
+            self._require(request, "POST")
+            payload = request.json()
+            player_id, player_name = parse_player(payload)
+            session_id = payload.get("session_id") or request.client
+            return 200, await self.service.commentary(player_id, player_name, str(session_id) if session_id else None)
+        if request.path == "/commentary/batch":
+            self._require(request, "POST")
+            return 200, {"results": await self.service.batch(parse_players(request.json()))}
+        raise HTTPError(404, f"No route for {request.path}")
+
+    async def stream(self, request: Request, writer: asyncio.StreamWriter) -> None:
+        if request.method == "GET":
+            players = [parse_player(request.query)]
+        else:
+            self._require(request, "POST")
+            players = parse_players(request.json())
+
+        writer.write(
+            b"HTTP/1.1 200 OK\r\n"
+            b"Content-Type: text/event-stream\r\n"
+            b"Cache-Control: no-cache\r\n"
+            b"Connection: close\r\n\r\n"
+        )
+        writer.write(encode_event("started", {"players": [{"player_id": p, "player_name": n} for p, n in players]}))
+        await writer.drain()
+        try:
+            async for result in self.service.stream(players):
+                writer.write(encode_event("commentary", result))
+                await writer.drain()
+        except ConnectionError:
+            raise
+        except Exception as e:
+            print(f"Error streaming commentary: {e}")
+            writer.write(encode_event("error", {"error": "Internal server error"}))
+        writer.write(encode_event("done", {}))
+        await writer.drain()
+
+    @staticmethod
+    def _require(request: Request, method: str) -> None:
+        if request.method != method:
+            raise HTTPError(405, f"{request.path} expects {method}")
+
+
+async def serve(sock: socket.socket, max_concurrency: int) -> None:
+    server = CommentaryServer(CommentaryService(max_concurrency))
+    async with await asyncio.start_server(server.handle_connection, sock=sock, limit=MAX_HEADER_BYTES) as listener:
+        await listener.serve_forever()
+
+
+def run_worker(sock: socket.socket, max_concurrency: int) -> None:
+    try:
+        asyncio.run(serve(sock, max_concurrency))
+    except KeyboardInterrupt:
+        pass
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Headless Top Bantz commentary API")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--workers", type=int, default=multiprocessing.cpu_count())
+    parser.add_argument("--max-concurrency", type=int, help="In-flight agent flows per worker")
+    parser.add_argument("--cache-path", default=".cache/commentary.sqlite3", help="Shared SQLite cache file")
+    args = parser.parse_args()
+
+    if args.cache_path:
+        os.makedirs(os.path.dirname(args.cache_path) or ".", exist_ok=True)
+        os.environ.setdefault("CACHE_PATH", args.cache_path)
+    # The orchestrator thread pool is sized from this, so it must be set before config.py is loaded
+    if args.max_concurrency:
+        os.environ["SERVER_MAX_CONCURRENCY"] = str(args.max_concurrency)
+    from config import SERVER_MAX_CONCURRENCY
+    max_concurrency = SERVER_MAX_CONCURRENCY
+
+    sock = socket.create_server((args.host, args.port), backlog=1024)
+    sock.set_inheritable(True)
+    print(f"Serving commentary on http://{args.host}:{args.port} with {args.workers} worker(s)")
+
+    if args.workers > 1 and "fork" not in multiprocessing.get_all_start_methods():
+        print("Multiple workers need fork(); running a single worker on this platform")
+        args.workers = 1
+    if args.workers <= 1:
+        run_worker(sock, max_concurrency)
+        return
+
+    context = multiprocessing.get_context("fork")
+    workers = [context.Process(target=run_worker, args=(sock, max_concurrency)) for _ in range(args.workers)]
+    for worker in workers:
+        worker.start()
+    try:
+        for worker in workers:
+            worker.join()
+    except KeyboardInterrupt:
+        for worker in workers:
+            worker.terminate()
+    finally:
+        sock.close()
+
+
+if __name__ == "__main__":
+    main()
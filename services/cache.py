@@ -0,0 +1,144 @@
+import json
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Optional, Tuple
+
+from config import CACHE_PATH, STAT_CACHE_TTL_S, FACT_CACHE_TTL_S, MEMORY_CACHE_TTL_S, COMMENTARY_CACHE_TTL_S
+
+
+class TTLCache:
+    """Thread-safe LRU cache whose entries go stale after ``ttl_seconds``.
+
+    Stale entries are kept (until evicted) so degraded paths can still use them
+    with ``allow_stale=True`` while an upstream is down.
+    """
+
+    def __init__(self, ttl_seconds: float, max_entries: int = 1024, clock: Callable[[], float] = time.time):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.clock = clock
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, allow_stale: bool = False) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            stored_at, value = entry
+            if not allow_stale and self.clock() - stored_at > self.ttl_seconds:
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        with self._lock:
+            self._entries[key] = (self.clock(), value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def pop(self, key: Hashable) -> Optional[Any]:
+        """Remove and return a fresh entry, so it is served only once"""
+        with self._lock:
+            entry = self._entries.pop(key, None)
+        if entry is None or self.clock() - entry[0] > self.ttl_seconds:
+            return None
+        return entry[1]
+
+
+class SQLiteCache:
+    """Same interface as ``TTLCache``, backed by a SQLite file shared between processes.
+
+    Values must be JSON-serialisable. Each thread gets its own connection; WAL mode
+    lets concurrent workers read while one writes.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        namespace: str,
+        ttl_seconds: float,
+        max_entries: int = 10000,
+        clock: Callable[[], float] = time.time
+    ):
+        self.path = path
+        self.namespace = namespace
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.clock = clock
+        self._local = threading.local()
+        with self._connection() as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS cache ("
+                "namespace TEXT NOT NULL, key TEXT NOT NULL, stored_at REAL NOT NULL, value TEXT NOT NULL, "
+                "PRIMARY KEY (namespace, key))"
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS cache_age ON cache (namespace, stored_at)")
+
+    def _connection(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=5, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def get(self, key: Hashable, allow_stale: bool = False) -> Optional[Any]:
+        row = self._connection().execute(
+            "SELECT stored_at, value FROM cache WHERE namespace = ? AND key = ?",
+            (self.namespace, str(key))
+        ).fetchone()
+        if row is None:
+            return None
+        stored_at, value = row
+        if not allow_stale and self.clock() - stored_at > self.ttl_seconds:
+            return None
+        return json.loads(value)
+
+    def set(self, key: Hashable, value: Any) -> None:
+        conn = self._connection()
+        conn.execute(
+            "INSERT OR REPLACE INTO cache (namespace, key, stored_at, value) VALUES (?, ?, ?, ?)",
+            (self.namespace, str(key), self.clock(), json.dumps(value))
+        )
+        conn.execute(
+            "DELETE FROM cache WHERE namespace = ? AND key IN ("
+            "SELECT key FROM cache WHERE namespace = ? ORDER BY stored_at DESC LIMIT -1 OFFSET ?)",
+            (self.namespace, self.namespace, self.max_entries)
+        )
+
+    def pop(self, key: Hashable) -> Optional[Any]:
+        """Remove and return a fresh entry, so it is served only once across all processes"""
+        conn = self._connection()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            row = conn.execute(
+                "SELECT stored_at, value FROM cache WHERE namespace = ? AND key = ?",
+                (self.namespace, str(key))
+            ).fetchone()
+            if row is not None:
+                conn.execute("DELETE FROM cache WHERE namespace = ? AND key = ?", (self.namespace, str(key)))
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+        if row is None or self.clock() - row[0] > self.ttl_seconds:
+            return None
+        return json.loads(row[1])
+
+
+def make_cache(namespace: str, ttl_seconds: float):
+    """Process-local cache, or a shared SQLite one when ``CACHE_PATH`` is configured"""
+    if CACHE_PATH:
+        return SQLiteCache(CACHE_PATH, namespace, ttl_seconds)
+    return TTLCache(ttl_seconds)
+
+
+stat_cache = make_cache("stats", STAT_CACHE_TTL_S)
+fact_cache = make_cache("facts", FACT_CACHE_TTL_S)
+memory_cache = make_cache("memory", MEMORY_CACHE_TTL_S)
+commentary_cache = make_cache("commentary", COMMENTARY_CACHE_TTL_S)
@@ -0,0 +1,81 @@
+import json
+import math
+from typing import Any, Dict, Iterator, List, Optional
+
+import requests
+
+from config import COMMENTARY_API_URL, COMMENTARY_DEADLINE_S, SERVER_MAX_CONCURRENCY
+
+# The server answers within its own deadline; leave room for queueing and transfer
+CLIENT_TIMEOUT_S = COMMENTARY_DEADLINE_S + 5
+CONNECT_TIMEOUT_S = 5
+
+
+def batch_timeout(size: int) -> float:
+    """A batch runs in waves of at most SERVER_MAX_CONCURRENCY flows, each within the deadline"""
+    return CLIENT_TIMEOUT_S * max(1, math.ceil(size / SERVER_MAX_CONCURRENCY))
+
+
+def _players(players: List[Dict[str, Any]]) -> Dict[str, Any]:
+    return {"players": [{"player_id": str(p["id"]), "player_name": p["name"]} for p in players]}
+
+
+def get_commentary(
+    player_id: str,
+    player_name: str,
+    session_id: Optional[str] = None,
+    base_url: str = COMMENTARY_API_URL
+) -> Optional[Dict[str, Any]]:
+    """``session_id`` scopes the server's speculative prefetching to one user"""
+    payload = {"player_id": str(player_id), "player_name": player_name}
+    if session_id:
+        payload["session_id"] = session_id
+    try:
+        res = requests.post(
+            f"{base_url}/commentary",
+            json=payload,
+            timeout=CLIENT_TIMEOUT_S
+        )
+        res.raise_for_status()
+        return res.json()
+    except Exception as e:
+        print(f"Error calling commentary API: {e}")
+        return None
+
+
+def get_commentaries(players: List[Dict[str, Any]], base_url: str = COMMENTARY_API_URL) -> List[Dict[str, Any]]:
+    """Commentary for several formation players in one round trip"""
+    try:
+        res = requests.post(
+            f"{base_url}/commentary/batch",
+            json=_players(players),
+            timeout=(CONNECT_TIMEOUT_S, batch_timeout(len(players)))
+        )
+        res.raise_for_status()
+        return res.json()["results"]
+    except Exception as e:
+        print(f"Error calling commentary API: {e}")
+        return []
+
+
+def stream_commentaries(players: List[Dict[str, Any]], base_url: str = COMMENTARY_API_URL) -> Iterator[Dict[str, Any]]:
+    """Yield each player's commentary as soon as the server finishes it"""
+    try:
+        with requests.post(
+            f"{base_url}/commentary/stream",
+            json=_players(players),
+            stream=True,
+            # A read timeout bounds the gap between events, not the whole stream
+            timeout=(CONNECT_TIMEOUT_S, CLIENT_TIMEOUT_S)
+        ) as res:
+            res.raise_for_status()
+            event = None
+            for line in res.iter_lines(decode_unicode=True):
+                if line.startswith("event:"):
+                    event = line.split(":", 1)[1].strip()
+                elif line.startswith("data:") and event == "commentary":
+                    yield json.loads(line.split(":", 1)[1])
+                elif line.startswith("data:") and event == "done":
+                    return
+    except Exception as e:
+        print(f"Error streaming from commentary API: {e}")
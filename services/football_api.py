@@ -1,20 +1,48 @@
 import requests
-from config import API_FOOTBALL_KEY
+from config import API_FOOTBALL_KEY, API_FOOTBALL_BASE_URL, UPSTREAM_TIMEOUT_S
+from services.cache import stat_cache
+from services.resilience import CircuitOpenError, get_breaker
 
-BASE_URL = "https://v3.football.api-sports.io"
+BASE_URL = API_FOOTBALL_BASE_URL
 
 HEADERS = {
     "x-apisports-key": API_FOOTBALL_KEY
 }
 
+def _get(url, params):
+    """GET through the API-Football circuit breaker; 5xx and rate limits count as failures"""
+    def request():
+        res = requests.get(url, headers=HEADERS, params=params, timeout=UPSTREAM_TIMEOUT_S)
+        if res.status_code >= 500 or res.status_code == 429:
+            res.raise_for_status()
+        return res
+
+    return get_breaker("api_football").call(request)
+
+
+def get_cached_stat(player_id, allow_stale=True):
+    """Structured stats from the last successful lookup, or None"""
+    return stat_cache.get(str(player_id), allow_stale=allow_stale)
+
+
 def get_player_stat(player_id):
+    cached = get_cached_stat(player_id, allow_stale=False)
+    if cached:
+        return cached["summary"]
+
     url = f"{BASE_URL}/players"
     params = {
         "id": player_id,
         "season": 2023
     }
 
-    res = requests.get(url, headers=HEADERS, params=params)
+    try:
+        res = _get(url, params)
+    except (CircuitOpenError, requests.RequestException) as e:
+        cached = get_cached_stat(player_id)
+        if cached:
+            return cached["summary"]
+        return f"No stats available for player ID {player_id}: {e}"
 
     if res.status_code != 200:
         return f"No stats available for player ID {player_id}"
@@ -32,6 +60,42 @@ def get_player_stat(player_id):
         minutes = stats["games"].get("minutes", 0)
         appearances = stats["games"].get("appearences", 0)
 
-        return f"{player_info['name']} scored {goals} goals, provided {assists} assists in {appearances} appearances playing {minutes} minutes."
+        summary = f"{player_info['name']} scored {goals} goals, provided {assists} assists in {appearances} appearances playing {minutes} minutes."
+        stat_cache.set(str(player_id), {
+            "name": player_info["name"],
+            "goals": goals,
+            "assists": assists,
+            "appearances": appearances,
+            "minutes": minutes,
+            "summary": summary
+        })
+        return summary
     except Exception as e:
-        return f"Failed to parse stats for player ID {player_id}: {e}"
\ No newline at end of file
+        return f"Failed to parse stats for player ID {player_id}: {e}"
+
+
+def _get_response(path, params):
+    res = _get(f"{BASE_URL}{path}", params)
+    res.raise_for_status()
+    return res.json().get("response") or []
+
+
+def get_fixture(fixture_id):
+    """Fixture header with live status, elapsed minute and score, or None if unknown"""
+    response = _get_response("/fixtures", {"id": fixture_id})
+    return response[0] if response else None
+
+
+def get_fixture_events(fixture_id):
+    """All events (goals, cards, subs, VAR) recorded so far for a fixture"""
+    return _get_response("/fixtures/events", {"fixture": fixture_id})
+
+
+def get_fixture_lineups(fixture_id):
+    """Starting XIs with formation grid positions, once the teams have been announced"""
+    return _get_response("/fixtures/lineups", {"fixture": fixture_id})
+
+
+def get_fixture_statistics(fixture_id):
+    """Per-team live statistics for a fixture"""
+    return _get_response("/fixtures/statistics", {"fixture": fixture_id})
@@ -0,0 +1,281 @@
+import asyncio
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from config import LIVE_POLL_MIN_S, LIVE_POLL_MAX_S, LIVE_FIXTURE_LOOKUP_ATTEMPTS
+from services.football_api import get_fixture, get_fixture_events, get_fixture_lineups, get_fixture_statistics
+
+
+BREAK_STATUSES = {"HT", "BT", "INT", "SUSP"}
+FINISHED_STATUSES = {"FT", "AET", "PEN", "PST", "CANC", "ABD", "AWD", "WO"}
+
+NARRATED_EVENT_TYPES = {"goal", "card", "subst", "var"}
+
+# Goal events that do not change the score
+NON_SCORING_GOAL_DETAILS = {"missed penalty"}
+# VAR decisions that take a goal back; the Goal event itself then drops out of the feed
+CANCELLED_GOAL_DETAILS = ("goal cancelled", "goal disallowed")
+
+
+def event_key(event: Dict[str, Any]) -> Tuple:
+    """Identity of an event across snapshots (the events list is cumulative)"""
+    time = event.get("time") or {}
+    return (
+        time.get("elapsed"),
+        time.get("extra"),
+        (event.get("team") or {}).get("id"),
+        (event.get("player") or {}).get("id"),
+        event.get("type"),
+        event.get("detail"),
+    )
+
+
+def to_live_event(event: Dict[str, Any]) -> Dict[str, Any]:
+    """Flatten an API-Football event into the shape the narration stage consumes"""
+    time = event.get("time") or {}
+    player = event.get("player") or {}
+    assist = event.get("assist") or {}
+    return {
+        "minute": time.get("elapsed"),
+        "extra": time.get("extra"),
+        "type": event.get("type"),
+        "detail": event.get("detail"),
+        "team": (event.get("team") or {}).get("name"),
+        "player_id": player.get("id"),
+        "player": player.get("name"),
+        "assist": assist.get("name"),
+        "comments": event.get("comments"),
+    }
+
+
+# Formation row for players whose lineup entry has no grid position
+POSITION_ROWS = {"G": 1, "D": 2, "M": 3, "F": 4}
+
+
+def lineup_positions(lineups: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Pitch coordinates (0-100) for both starting XIs: home attacks left to right, away mirrored"""
+    players = []
+    for index, lineup in enumerate(lineups[:2]):
+        rows: Dict[int, List[Tuple[int, Dict[str, Any]]]] = {}
+        for entry in lineup.get("startXI") or []:
+            player = entry.get("player") or {}
+            grid = player.get("grid")
+            if grid and ":" in grid:
+                row, col = (int(part) for part in grid.split(":", 1))
+            else:
+                row = POSITION_ROWS.get(player.get("pos"), 3)
+                col = len(rows.get(row, [])) + 1
+            rows.setdefault(row, []).append((col, player))
+
+        last_row = max(rows, default=1)
+        for row, row_players in rows.items():
+            x = 5 + 40 * (row - 1) / max(last_row - 1, 1)
+            for position, (_, player) in enumerate(sorted(row_players, key=lambda item: item[0]), start=1):
+                y = 100 * position / (len(row_players) + 1)
+                players.append({
+                    "id": player.get("id"),
+                    "name": player.get("name"),
+                    "x": x if index == 0 else 100 - x,
+                    "y": y if index == 0 else 100 - y,
+                    "team": (lineup.get("team") or {}).get("name"),
+                })
+    return players
+
+
+def substitute(players: List[Dict[str, Any]], event: Dict[str, Any]) -> None:
+    """Put the player coming on (the event's ``assist``) in the place of the one going off"""
+    off = (event.get("player") or {}).get("id")
+    on = event.get("assist") or {}
+    if off is None or on.get("id") is None:
+        return
+    for player in players:
+        if player["id"] == off:
+            player.update(id=on["id"], name=on.get("name"))
+            return
+
+
+class EventDiffer:
+    """Tracks which events have been seen so each snapshot only yields the new ones"""
+
+    def __init__(self):
+        self._seen: Set[Tuple] = set()
+        self._last_count = 0
+        self._last_key: Optional[Tuple] = None
+
+    def diff(self, events: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        # Unchanged snapshot: same length and same tail, nothing to walk
+        if events and len(events) == self._last_count and event_key(events[-1]) == self._last_key:
+            return []
+
+        new_events = []
+        for event in events:
+            key = event_key(event)
+            if key not in self._seen:
+                self._seen.add(key)
+                new_events.append(event)
+
+        self._last_count = len(events)
+        self._last_key = event_key(events[-1]) if events else None
+        return new_events
+
+
+class RunningScore:
+    """Score rebuilt from Goal events in order, so each event carries the score as it stood then.
+
+    VAR "Goal cancelled" events take a goal back. The event feed never reports the
+    removal itself, so ``reconcile`` also lowers a side to the fixture header's score.
+    """
+
+    def __init__(self):
+        self.home = 0
+        self.away = 0
+        self._sides: Dict[Any, str] = {}
+
+    def set_teams(self, fixture: Dict[str, Any]) -> None:
+        teams = fixture.get("teams") or {}
+        for side in ("home", "away"):
+            team_id = (teams.get(side) or {}).get("id")
+            if team_id is not None:
+                self._sides[team_id] = side
+
+    def apply(self, event: Dict[str, Any]) -> bool:
+        """Update the score for one event; True if the event changed it"""
+        event_type = (event.get("type") or "").lower()
+        detail = (event.get("detail") or "").lower()
+        side = self._sides.get((event.get("team") or {}).get("id"))
+        if side is None:
+            return False
+        if event_type == "var" and detail.startswith(CANCELLED_GOAL_DETAILS):
+            if getattr(self, side) == 0:
+                return False
+            setattr(self, side, getattr(self, side) - 1)
+            return True
+        if event_type != "goal" or detail in NON_SCORING_GOAL_DETAILS or event.get("comments") == "Penalty Shootout":
+            return False
+        setattr(self, side, getattr(self, side) + 1)
+        return True
+
+    def reconcile(self, header: Dict[str, Any]) -> None:
+        """Never run ahead of the fixture header (a goal was ruled out); it may lag behind the events"""
+        for side in ("home", "away"):
+            if isinstance(header.get(side), int):
+                setattr(self, side, min(getattr(self, side), header[side]))
+
+    def as_dict(self) -> Dict[str, int]:
+        return {"home": self.home, "away": self.away}
+
+
+class LiveMatchPoller:
+    """Polls a fixture on an adaptive interval and pushes new events onto a bounded queue.
+
+    The interval drops to the minimum when something happens and backs off while the
+    match is quiet or at a break. ``queue.put`` blocks when the queue is full, so a slow
+    narration stage throttles polling instead of piling up events.
+
+    Events already in the first snapshot (joining mid-match) only feed the running
+    score; narration starts with the first event that happens while following.
+    Polling stops with ``error`` set if the fixture is never found. ``lineup`` holds the
+    players on the pitch (starting XIs with substitutions applied) once announced.
+    """
+
+    def __init__(
+        self,
+        fixture_id: str,
+        queue: asyncio.Queue,
+        min_interval: float = LIVE_POLL_MIN_S,
+        max_interval: float = LIVE_POLL_MAX_S,
+        lookup_attempts: int = LIVE_FIXTURE_LOOKUP_ATTEMPTS
+    ):
+        self.fixture_id = fixture_id
+        self.queue = queue
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.interval = min_interval
+        self.lookup_attempts = lookup_attempts
+        self._missed_lookups = 0
+        self.differ = EventDiffer()
+        self.running_score = RunningScore()
+        self._caught_up = False
+        self.status: Optional[str] = None
+        self.elapsed: Optional[int] = None
+        self.score: Dict[str, Any] = {}
+        self.statistics: List[Dict[str, Any]] = []
+        self.lineup: List[Dict[str, Any]] = []
+        self.error: Optional[str] = None
+        self._stopped = False
+
+    def stop(self) -> None:
+        self._stopped = True
+
+    @property
+    def finished(self) -> bool:
+        return self._stopped or self.error is not None or self.status in FINISHED_STATUSES
+
+    async def poll_once(self) -> List[Dict[str, Any]]:
+        """Fetch one snapshot and return the new events in it"""
+        fixture = await asyncio.to_thread(get_fixture, self.fixture_id)
+        if fixture:
+            status = (fixture.get("fixture") or {}).get("status") or {}
+            self.status = status.get("short")
+            self.elapsed = status.get("elapsed")
+            self.score = fixture.get("goals") or {}
+            self.running_score.set_teams(fixture)
+        elif self.status is None:
+            # Goals cannot be credited to a side until the fixture header has been seen
+            self._missed_lookups += 1
+            if self._missed_lookups >= self.lookup_attempts:
+                self.error = f"Fixture {self.fixture_id} was not found"
+            return []
+
+        if not self.lineup:
+            try:
+                self.lineup = lineup_positions(await asyncio.to_thread(get_fixture_lineups, self.fixture_id))
+            except Exception as e:
+                print(f"Error fetching lineups for fixture {self.fixture_id}: {e}")
+
+        events, statistics = await asyncio.gather(
+            asyncio.to_thread(get_fixture_events, self.fixture_id),
+            asyncio.to_thread(get_fixture_statistics, self.fixture_id),
+        )
+        self.statistics = statistics
+
+        history = not self._caught_up
+        self._caught_up = True
+        new_events = []
+        scored = False
+        for event in self.differ.diff(events):
+            scored = self.running_score.apply(event) or scored
+            if (event.get("type") or "").lower() == "subst":
+                substitute(self.lineup, event)
+            if history or (event.get("type") or "").lower() not in NARRATED_EVENT_TYPES:
+                continue
+            new_events.append({**to_live_event(event), "score": self.running_score.as_dict()})
+        # Only reconcile on a quiet snapshot: the header may have been read before a new goal landed
+        if not scored:
+            self.running_score.reconcile(self.score)
+        return new_events
+
+    def _next_interval(self, new_events: int) -> float:
+        if self.status in BREAK_STATUSES:
+            return self.max_interval
+        if new_events:
+            return self.min_interval
+        return min(self.max_interval, self.interval * 1.5)
+
+    async def run(self) -> None:
+        """Poll until the match finishes, then push a ``None`` sentinel"""
+        while not self.finished:
+            try:
+                new_events = await self.poll_once()
+            except Exception as e:
+                print(f"Error polling fixture {self.fixture_id}: {e}")
+                new_events = []
+
+            for event in new_events:
+                await self.queue.put(event)
+
+            if self.finished:
+                break
+            self.interval = self._next_interval(len(new_events))
+            await asyncio.sleep(self.interval)
+
+        await self.queue.put(None)
@@ -0,0 +1,227 @@
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Any, Deque, Dict, Optional
+from uuid import UUID
+
+from langchain_core.callbacks import BaseCallbackHandler
+from langchain_openai import ChatOpenAI
+
+from config import (
+    OPENAI_API_KEY,
+    OPENAI_TIMEOUT_S,
+    MODEL_ROUTES,
+    NARRATION_HEDGE_ENABLED,
+    NARRATION_HEDGE_DEFAULT_MS,
+    NARRATION_HEDGE_MIN_SAMPLES,
+    NARRATION_HEDGE_BUDGET_RATIO,
+    NARRATION_HEDGE_BUDGET_BURST,
+)
+from services.resilience import CircuitBreaker, CircuitOpenError, get_breaker
+
+
+STAGE_TEMPERATURES = {
+    "orchestrator": 0.7,
+    "stat": 0,
+    "fact": 0.3,
+    "memory": 0,
+    "narration_planner": 0,
+    "narration": 0.8,
+}
+
+
+class CircuitBreakerCallback(BaseCallbackHandler):
+    """Feeds every chat model call into the OpenAI circuit breaker.
+
+    ``raise_error`` makes LangChain propagate the ``CircuitOpenError`` raised on
+    start, so agent chains stop at their next model call once the circuit opens.
+    """
+
+    raise_error: bool = True
+
+    def __init__(self, breaker: CircuitBreaker):
+        self.breaker = breaker
+        self._started: Dict[UUID, float] = {}
+        self._lock = threading.Lock()
+
+    def _start(self, run_id: UUID) -> None:
+        if not self.breaker.allow():
+            raise CircuitOpenError(f"{self.breaker.name} circuit is open")
+        with self._lock:
+            self._started[run_id] = time.monotonic()
+
+    def _finish(self, run_id: UUID, ok: bool) -> None:
+        with self._lock:
+            started = self._started.pop(run_id, None)
+        if started is not None:
+            self.breaker.record(time.monotonic() - started, ok=ok)
+
+    def on_chat_model_start(self, serialized, messages, *, run_id: UUID, **kwargs) -> None:
+        self._start(run_id)
+
+    def on_llm_start(self, serialized, prompts, *, run_id: UUID, **kwargs) -> None:
+        self._start(run_id)
+
+    def on_llm_end(self, response, *, run_id: UUID, **kwargs) -> None:
+        self._finish(run_id, ok=True)
+
+    def on_llm_error(self, error, *, run_id: UUID, **kwargs) -> None:
+        self._finish(run_id, ok=False)
+
+
+openai_breaker_callback = CircuitBreakerCallback(get_breaker("openai"))
+
+
+class ModelRouter:
+    """Picks the chat model for each pipeline stage from configuration"""
+
+    def __init__(self, routes: Optional[Dict[str, str]] = None):
+        self.routes = dict(routes or MODEL_ROUTES)
+        self._models: Dict[str, ChatOpenAI] = {}
+        self._lock = threading.Lock()
+
+    def model_for(self, stage: str) -> str:
+        if stage not in self.routes:
+            raise ValueError(f"Unknown model routing stage: {stage}")
+        return self.routes[stage]
+
+    def get_llm(self, stage: str) -> ChatOpenAI:
+        """Return a shared client for the stage, creating it on first use"""
+        model = self.model_for(stage)
+        with self._lock:
+            llm = self._models.get(stage)
+            if llm is None:
+                llm = ChatOpenAI(
+                    model=model,
+                    temperature=STAGE_TEMPERATURES.get(stage, 0.7),
+                    openai_api_key=OPENAI_API_KEY,
+                    timeout=OPENAI_TIMEOUT_S,
+                    max_retries=1,
+                    callbacks=[openai_breaker_callback]
+                )
+                self._models[stage] = llm
+            return llm
+
+
+class LatencyTracker:
+    """Rolling window of observed latencies used to derive the hedging threshold"""
+
+    def __init__(
+        self,
+        default_ms: float = NARRATION_HEDGE_DEFAULT_MS,
+        min_samples: int = NARRATION_HEDGE_MIN_SAMPLES,
+        window: int = 200
+    ):
+        self.default_ms = default_ms
+        self.min_samples = min_samples
+        self._samples: Deque[float] = deque(maxlen=window)
+        self._lock = threading.Lock()
+
+    def record(self, seconds: float) -> None:
+        with self._lock:
+            self._samples.append(seconds)
+
+    def p95(self) -> Optional[float]:
+        with self._lock:
+            if len(self._samples) < self.min_samples:
+                return None
+            ordered = sorted(self._samples)
+        return ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))]
+
+    def hedge_delay(self) -> float:
+        """Seconds to wait for the primary request before hedging"""
+        observed = self.p95()
+        return observed if observed is not None else self.default_ms / 1000
+
+
+class HedgeBudget:
+    """Token bucket that lets at most ``ratio`` of requests hedge.
+
+    Every request deposits ``ratio`` tokens (capped at ``burst``) and every hedge
+    spends one, so hedging cannot double the load on an upstream that is already slow.
+    """
+
+    def __init__(
+        self,
+        ratio: float = NARRATION_HEDGE_BUDGET_RATIO,
+        burst: float = NARRATION_HEDGE_BUDGET_BURST
+    ):
+        self.ratio = ratio
+        self.burst = burst
+        self._tokens = 0.0
+        self._lock = threading.Lock()
+
+    def deposit(self) -> None:
+        with self._lock:
+            self._tokens = min(self.burst, self._tokens + self.ratio)
+
+    def try_spend(self) -> bool:
+        with self._lock:
+            if self._tokens < 1:
+                return False
+            self._tokens -= 1
+            return True
+
+
+_hedge_pool = ThreadPoolExecutor(max_workers=16, thread_name_prefix="hedge")
+
+narration_latency = LatencyTracker()
+narration_hedge_budget = HedgeBudget()
+
+
+def hedged_invoke(
+    llm: ChatOpenAI,
+    messages: Any,
+    tracker: LatencyTracker = narration_latency,
+    budget: HedgeBudget = narration_hedge_budget
+) -> Any:
+    """Invoke the model, firing a second request if the first outlives the p95 threshold.
+
+    The threshold is measured from when the primary request starts running, not from
+    when it was queued, and a hedge is only sent while ``budget`` allows it. Whichever
+    request finishes first wins; the other one is left to finish in the background
+    and its result is discarded.
+    """
+    budget.deposit()
+    started = threading.Event()
+    start = [0.0]
+
+    def primary() -> Any:
+        start[0] = time.monotonic()
+        started.set()
+        return llm.invoke(messages)
+
+    pending = {_hedge_pool.submit(primary)}
+    started.wait()
+    done, pending = wait(pending, timeout=tracker.hedge_delay())
+    if not done and budget.try_spend():
+        pending.add(_hedge_pool.submit(llm.invoke, messages))
+
+    error: Optional[BaseException] = None
+    while True:
+        for future in done:
+            if future.exception() is None:
+                tracker.record(time.monotonic() - start[0])
+                for loser in pending:
+                    loser.cancel()
+                return future.result()
+            error = error or future.exception()
+        if not pending:
+            raise error
+        done, pending = wait(pending, return_when=FIRST_COMPLETED)
+
+
+router = ModelRouter()
+
+
+def get_llm(stage: str) -> ChatOpenAI:
+    return router.get_llm(stage)
+
+
+def invoke_narration(messages: Any) -> Any:
+    """Run a narration call through the narration model, hedged when enabled"""
+    llm = get_llm("narration")
+    if NARRATION_HEDGE_ENABLED:
+        return hedged_invoke(llm, messages)
+    return llm.invoke(messages)
@@ -0,0 +1,103 @@
+import threading
+import time
+from typing import Any, Callable, Dict, Optional
+
+from config import UPSTREAM_SLO_MS, BREAKER_FAILURE_THRESHOLD, BREAKER_RESET_S
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of calling an upstream whose circuit is open"""
+
+
+class CircuitBreaker:
+    """Consecutive-failure circuit breaker with a latency SLO.
+
+    Calls slower than the SLO count as failures even when they succeed, so a
+    degraded upstream trips the breaker just like a dead one. After
+    ``reset_timeout`` seconds a single trial call is let through (half-open);
+    its outcome closes or re-opens the circuit.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(
+        self,
+        name: str,
+        slo_ms: Optional[float] = None,
+        failure_threshold: int = BREAKER_FAILURE_THRESHOLD,
+        reset_timeout: float = BREAKER_RESET_S,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        self.name = name
+        self.slo_ms = slo_ms
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.clock = clock
+        self.failures = 0
+        self._state = self.CLOSED
+        self._opened_at = 0.0
+        self._trial_in_flight = False
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            if self._state == self.OPEN and self.clock() - self._opened_at >= self.reset_timeout:
+                return self.HALF_OPEN
+            return self._state
+
+    def is_open(self) -> bool:
+        """True while calls would be rejected (does not consume the half-open trial)"""
+        with self._lock:
+            if self._state != self.OPEN:
+                return self._trial_in_flight
+            return self.clock() - self._opened_at < self.reset_timeout
+
+    def allow(self) -> bool:
+        with self._lock:
+            if self._state == self.CLOSED:
+                return True
+            if self._trial_in_flight:
+                return False
+            if self._state == self.OPEN and self.clock() - self._opened_at < self.reset_timeout:
+                return False
+            self._state = self.HALF_OPEN
+            self._trial_in_flight = True
+            return True
+
+    def record(self, latency_s: float, ok: bool = True) -> None:
+        if ok and self.slo_ms is not None and latency_s * 1000 > self.slo_ms:
+            ok = False
+        with self._lock:
+            self._trial_in_flight = False
+            if ok:
+                self.failures = 0
+                self._state = self.CLOSED
+                return
+            self.failures += 1
+            if self._state == self.HALF_OPEN or self.failures >= self.failure_threshold:
+                self._state = self.OPEN
+                self._opened_at = self.clock()
+
+    def call(self, fn: Callable[..., Any], *args, **kwargs) -> Any:
+        if not self.allow():
+            raise CircuitOpenError(f"{self.name} circuit is open")
+        start = self.clock()
+        try:
+            result = fn(*args, **kwargs)
+        except Exception:
+            self.record(self.clock() - start, ok=False)
+            raise
+        self.record(self.clock() - start)
+        return result
+
+
+breakers: Dict[str, CircuitBreaker] = {
+    name: CircuitBreaker(name, slo_ms=slo_ms) for name, slo_ms in UPSTREAM_SLO_MS.items()
+}
+
+
+def get_breaker(name: str) -> CircuitBreaker:
+    return breakers[name]
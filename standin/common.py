@@ -0,0 +1,90 @@
+"""Shared plumbing for the local upstream stand-ins: latency injection and call counting."""
+import json
+import random
+import threading
+import time
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, Optional
+
+
+class UpstreamStats:
+    """Thread-safe per-endpoint request counter"""
+
+    def __init__(self):
+        self._counts: Counter = Counter()
+        self._lock = threading.Lock()
+
+    def hit(self, endpoint: str) -> None:
+        with self._lock:
+            self._counts[endpoint] += 1
+
+    def snapshot(self) -> Dict[str, int]:
+        with self._lock:
+            return dict(self._counts)
+
+    def total(self) -> int:
+        with self._lock:
+            return sum(self._counts.values())
+
+    def reset(self) -> None:
+        with self._lock:
+            self._counts.clear()
+
+
+class LatencyInjector:
+    """Sleeps for ``latency_ms`` plus uniform jitter, with an optional slow tail"""
+
+    def __init__(
+        self,
+        latency_ms: float = 0,
+        jitter_ms: float = 0,
+        tail_ratio: float = 0,
+        tail_ms: float = 0,
+        seed: Optional[int] = None
+    ):
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.tail_ratio = tail_ratio
+        self.tail_ms = tail_ms
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+
+    def delay(self) -> float:
+        with self._lock:
+            delay_ms = self.latency_ms + self._random.uniform(0, self.jitter_ms)
+            if self.tail_ratio and self._random.random() < self.tail_ratio:
+                delay_ms += self.tail_ms
+        return delay_ms / 1000
+
+    def sleep(self) -> None:
+        delay = self.delay()
+        if delay > 0:
+            time.sleep(delay)
+
+
+class StandInHandler(BaseHTTPRequestHandler):
+    """Base handler: quiet logging and JSON helpers"""
+
+    def read_json(self) -> Dict[str, Any]:
+        length = int(self.headers.get("Content-Length") or 0)
+        return json.loads(self.rfile.read(length) or b"{}")
+
+    def send_json(self, payload: Any, status: int = 200) -> None:
+        body = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def start_in_thread(server: ThreadingHTTPServer) -> str:
+    """Serve on a daemon thread and return the server's base URL"""
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, name=type(server).__name__, daemon=True).start()
+    host, port = server.server_address[:2]
+    return f"http://{host}:{port}"
@@ -0,0 +1,213 @@
+"""Local stand-in for API-Football that replays a recorded match.
+
+Point the app at it with ``API_FOOTBALL_BASE_URL=http://127.0.0.1:8765`` and run::
+
+    python -m standin.football_server --replay data/replays/sample_match.json --speed 60
+
+``--speed`` is match minutes per real minute, so 60 plays a full match in about two minutes.
+``/players`` answers with deterministic season stats for any player ID, named from
+``data/formations.json`` where possible.
+"""
+import argparse
+import json
+import random
+import time
+from http.server import ThreadingHTTPServer
+from typing import Any, Dict, List, Optional
+from urllib.parse import parse_qs, urlparse
+
+from standin.common import LatencyInjector, StandInHandler, UpstreamStats
+
+
+HALF_TIME_BREAK = 15
+
+
+class MatchReplay:
+    """Serves fixture snapshots as they looked at the current point of a replayed match"""
+
+    def __init__(self, recording: Dict[str, Any], speed: float = 1.0, clock=time.monotonic):
+        self.recording = recording
+        self.speed = speed
+        self.clock = clock
+        self.started_at = clock()
+
+        events = recording["events"]
+        first_half = [e for e in events if e["time"]["elapsed"] <= 45]
+        second_half = [e for e in events if e["time"]["elapsed"] > 45]
+        self.first_half_end = max([45] + [self._match_time(e) for e in first_half])
+        self.second_half_start = self.first_half_end + HALF_TIME_BREAK
+        self.full_time = self.second_half_start + max([90] + [self._match_time(e) for e in second_half]) - 45
+
+    @classmethod
+    def from_file(cls, path: str, speed: float = 1.0) -> "MatchReplay":
+        with open(path) as f:
+            return cls(json.load(f), speed)
+
+    @property
+    def fixture_id(self) -> int:
+        return self.recording["fixture"]["fixture"]["id"]
+
+    @staticmethod
+    def _match_time(event: Dict[str, Any]) -> int:
+        return event["time"]["elapsed"] + (event["time"].get("extra") or 0)
+
+    def clock_minute(self) -> float:
+        """Minutes of wall-clock match time (including the break) since kick-off"""
+        return (self.clock() - self.started_at) * self.speed / 60
+
+    def _event_clock(self, event: Dict[str, Any]) -> float:
+        if event["time"]["elapsed"] <= 45:
+            return self._match_time(event)
+        return self.second_half_start + self._match_time(event) - 45
+
+    def status(self) -> Dict[str, Any]:
+        minute = self.clock_minute()
+        if minute < self.first_half_end:
+            return {"long": "First Half", "short": "1H", "elapsed": min(45, int(minute))}
+        if minute < self.second_half_start:
+            return {"long": "Halftime", "short": "HT", "elapsed": 45}
+        if minute < self.full_time:
+            return {"long": "Second Half", "short": "2H", "elapsed": min(90, 45 + int(minute - self.second_half_start))}
+        return {"long": "Match Finished", "short": "FT", "elapsed": 90}
+
+    def events(self) -> List[Dict[str, Any]]:
+        minute = self.clock_minute()
+        return [e for e in self.recording["events"] if self._event_clock(e) <= minute]
+
+    def fixture(self) -> Dict[str, Any]:
+        fixture = json.loads(json.dumps(self.recording["fixture"]))
+        fixture["fixture"]["status"] = self.status()
+
+        teams = fixture["teams"]
+        goals = {"home": 0, "away": 0}
+        for event in self.events():
+            if event["type"] == "Goal" and event["detail"] != "Missed Penalty":
+                side = "home" if event["team"]["id"] == teams["home"]["id"] else "away"
+                goals[side] += 1
+        fixture["goals"] = goals
+        return fixture
+
+    def statistics(self) -> List[Dict[str, Any]]:
+        """Full-time statistics scaled down to the minutes played so far"""
+        progress = min(1.0, self.status()["elapsed"] / 90)
+        snapshot = []
+        for team in self.recording["statistics"]:
+            stats = []
+            for stat in team["statistics"]:
+                value = stat["value"]
+                if isinstance(value, int):
+                    value = int(value * progress)
+                stats.append({"type": stat["type"], "value": value})
+            snapshot.append({"team": team["team"], "statistics": stats})
+        return snapshot
+
+
+def _envelope(path: str, params: Dict[str, str], response: List[Any]) -> Dict[str, Any]:
+    return {
+        "get": path.lstrip("/"),
+        "parameters": params,
+        "errors": [],
+        "results": len(response),
+        "paging": {"current": 1, "total": 1},
+        "response": response,
+    }
+
+
+def load_player_names(path: str = "data/formations.json") -> Dict[int, str]:
+    try:
+        with open(path) as f:
+            formations = json.load(f)
+    except OSError:
+        return {}
+    return {p["id"]: p["name"] for players in formations.values() for p in players}
+
+
+def player_season(player_id: int, name: str) -> Dict[str, Any]:
+    """Plausible, deterministic season stats in API-Football's /players shape"""
+    rng = random.Random(player_id)
+    appearances = rng.randint(18, 38)
+    return {
+        "player": {"id": player_id, "name": name},
+        "statistics": [{
+            "games": {"appearences": appearances, "minutes": appearances * rng.randint(60, 90)},
+            "goals": {"total": rng.randint(0, 30), "assists": rng.randint(0, 15)},
+        }],
+    }
+
+
+def make_handler(
+    replay: Optional[MatchReplay],
+    latency: Optional[LatencyInjector] = None,
+    stats: Optional[UpstreamStats] = None,
+    player_names: Optional[Dict[int, str]] = None
+):
+    latency = latency or LatencyInjector()
+    stats = stats or UpstreamStats()
+    player_names = player_names if player_names is not None else load_player_names()
+
+    class ReplayHandler(StandInHandler):
+        def do_GET(self):
+            url = urlparse(self.path)
+            params = {k: v[0] for k, v in parse_qs(url.query).items()}
+            stats.hit(url.path)
+            latency.sleep()
+
+            response: Optional[List[Any]]
+            if url.path == "/players":
+                player_id = int(params.get("id", 0))
+                response = [player_season(player_id, player_names.get(player_id, f"Player {player_id}"))]
+            elif replay is None or url.path not in ("/fixtures", "/fixtures/events", "/fixtures/lineups", "/fixtures/statistics"):
+                response = None
+            elif str(params.get("id") or params.get("fixture")) != str(replay.fixture_id):
+                response = []
+            elif url.path == "/fixtures":
+                response = [replay.fixture()]
+            elif url.path == "/fixtures/events":
+                response = replay.events()
+            elif url.path == "/fixtures/lineups":
+                response = replay.recording.get("lineups", [])
+            else:
+                response = replay.statistics()
+
+            if response is None:
+                self.send_error(404)
+                return
+            self.send_json(_envelope(url.path, params, response))
+
+    return ReplayHandler
+
+
+def serve(
+    replay: Optional[MatchReplay],
+    host: str = "127.0.0.1",
+    port: int = 8765,
+    latency: Optional[LatencyInjector] = None,
+    stats: Optional[UpstreamStats] = None
+) -> ThreadingHTTPServer:
+    """Create the server; call ``serve_forever`` (or run it on a thread) to start answering"""
+    return ThreadingHTTPServer((host, port), make_handler(replay, latency, stats))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Replay a recorded match as a stand-in API-Football server")
+    parser.add_argument("--replay", default="data/replays/sample_match.json")
+    parser.add_argument("--speed", type=float, default=60.0, help="Match minutes per real minute")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency-ms", type=float, default=0)
+    parser.add_argument("--jitter-ms", type=float, default=0)
+    args = parser.parse_args()
+
+    replay = MatchReplay.from_file(args.replay, args.speed)
+    server = serve(replay, args.host, args.port, LatencyInjector(args.latency_ms, args.jitter_ms))
+    print(f"Replaying fixture {replay.fixture_id} on http://{args.host}:{args.port} at {args.speed}x")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
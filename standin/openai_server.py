@@ -0,0 +1,180 @@
+"""Local stand-in for the OpenAI chat completions API.
+
+It plays the agent workflow deterministically: while a request offers functions
+(or tools) it has not called yet in the conversation, it calls the next one with
+arguments pulled from the prompt; otherwise it answers with canned commentary.
+Both plain and streamed (SSE) responses are supported, because LangChain agents
+stream their planning calls.
+"""
+import argparse
+import json
+import re
+import time
+import uuid
+from http.server import ThreadingHTTPServer
+from typing import Any, Dict, List, Optional, Tuple
+
+from standin.common import LatencyInjector, StandInHandler, UpstreamStats
+
+
+def _text(message: Dict[str, Any]) -> str:
+    content = message.get("content") or ""
+    if isinstance(content, list):
+        return " ".join(part.get("text", "") for part in content if isinstance(part, dict))
+    return content
+
+
+def _context(messages: List[Dict[str, Any]]) -> Dict[str, str]:
+    """Pull player details and earlier tool results out of the conversation"""
+    # User turns first: system prompts mention "player ID:" followed by numbered lists
+    text = "\n".join(
+        [_text(m) for m in messages if m.get("role") == "user"]
+        + [_text(m) for m in messages if m.get("role") == "system"]
+    )
+    player_id = re.search(r"ID:\s*(\d+)", text)
+    player_name = (
+        re.search(r"for player ([^(\n]+?) \(ID", text)
+        or re.search(r"about player: ([^\n(]+)", text)
+        or re.search(r"player: ([^\n(]+)", text)
+        or re.search(r"fact for ([^:\n]+):", text)
+        or re.search(r"commentary for ([^\n]+?) using", text)
+    )
+    results = {m.get("name"): _text(m) for m in messages if m.get("role") in ("function", "tool")}
+    return {
+        "player_id": player_id.group(1) if player_id else "0",
+        "player_name": player_name.group(1).strip() if player_name else "the player",
+        "stat": results.get("stat_agent") or results.get("get_player_stat") or "Solid numbers this season.",
+        "fact": results.get("fact_agent") or results.get("search_google_for_fact") or "A fan favourite.",
+        "action": "store",
+    }
+
+
+def _called(messages: List[Dict[str, Any]]) -> set:
+    names = set()
+    for message in messages:
+        if message.get("function_call"):
+            names.add(message["function_call"].get("name"))
+        for call in message.get("tool_calls") or []:
+            names.add(call["function"]["name"])
+        if message.get("role") == "function":
+            names.add(message.get("name"))
+    return names
+
+
+def next_step(body: Dict[str, Any]) -> Tuple[Optional[Tuple[str, str]], Optional[str]]:
+    """Either ``(function name, JSON arguments)`` to call, or the final content"""
+    messages = body.get("messages", [])
+    functions = body.get("functions") or [t["function"] for t in body.get("tools") or []]
+    context = _context(messages)
+
+    called = _called(messages)
+    for function in functions:
+        if function["name"] in called:
+            continue
+        properties = (function.get("parameters") or {}).get("properties", {})
+        arguments = {key: context[key] for key in properties if key in context}
+        return (function["name"], json.dumps(arguments)), None
+
+    return None, (
+        f"What a player {context['player_name']} is! {context['stat'][:160]} "
+        f"And did you know? {context['fact'][:160]}"
+    )
+
+
+def completion(body: Dict[str, Any]) -> Dict[str, Any]:
+    call, content = next_step(body)
+    message: Dict[str, Any] = {"role": "assistant", "content": content}
+    finish_reason = "stop"
+    if call and body.get("tools"):
+        message["tool_calls"] = [{
+            "id": f"call_{uuid.uuid4().hex[:12]}",
+            "type": "function",
+            "function": {"name": call[0], "arguments": call[1]},
+        }]
+        finish_reason = "tool_calls"
+    elif call:
+        message["function_call"] = {"name": call[0], "arguments": call[1]}
+        finish_reason = "function_call"
+    return {
+        "id": f"chatcmpl-{uuid.uuid4().hex[:12]}",
+        "object": "chat.completion",
+        "created": int(time.time()),
+        "model": body.get("model", "stand-in"),
+        "choices": [{"index": 0, "message": message, "finish_reason": finish_reason, "logprobs": None}],
+        "usage": {"prompt_tokens": 100, "completion_tokens": 40, "total_tokens": 140},
+    }
+
+
+def stream_chunks(response: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Split a completion into the delta chunks of a streamed response"""
+    choice = response["choices"][0]
+    delta = {k: v for k, v in choice["message"].items() if v is not None}
+    if "tool_calls" in delta:
+        delta["tool_calls"] = [{"index": 0, **call} for call in delta["tool_calls"]]
+    base = {k: response[k] for k in ("id", "created", "model")}
+    base["object"] = "chat.completion.chunk"
+    return [
+        {**base, "choices": [{"index": 0, "delta": delta, "finish_reason": None, "logprobs": None}]},
+        {**base, "choices": [{"index": 0, "delta": {}, "finish_reason": choice["finish_reason"], "logprobs": None}]},
+    ]
+
+
+def make_handler(latency: Optional[LatencyInjector] = None, stats: Optional[UpstreamStats] = None):
+    latency = latency or LatencyInjector()
+    stats = stats or UpstreamStats()
+
+    class OpenAIHandler(StandInHandler):
+        def do_POST(self):
+            stats.hit(self.path)
+            latency.sleep()
+            if not self.path.rstrip("/").endswith("/chat/completions"):
+                self.send_error(404)
+                return
+
+            body = self.read_json()
+            response = completion(body)
+            if not body.get("stream"):
+                self.send_json(response)
+                return
+
+            self.send_response(200)
+            self.send_header("Content-Type", "text/event-stream")
+            self.send_header("Connection", "close")
+            self.end_headers()
+            for chunk in stream_chunks(response):
+                self.wfile.write(f"data: {json.dumps(chunk)}\n\n".encode())
+            self.wfile.write(b"data: [DONE]\n\n")
+            self.close_connection = True
+
+    return OpenAIHandler
+
+
+def serve(
+    host: str = "127.0.0.1",
+    port: int = 8767,
+    latency: Optional[LatencyInjector] = None,
+    stats: Optional[UpstreamStats] = None
+) -> ThreadingHTTPServer:
+    """Point clients at ``http://host:port/v1``"""
+    return ThreadingHTTPServer((host, port), make_handler(latency, stats))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Stand-in OpenAI chat completions server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8767)
+    parser.add_argument("--latency-ms", type=float, default=0)
+    parser.add_argument("--jitter-ms", type=float, default=0)
+    args = parser.parse_args()
+
+    server = serve(args.host, args.port, LatencyInjector(args.latency_ms, args.jitter_ms))
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
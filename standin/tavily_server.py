@@ -0,0 +1,74 @@
+"""Local stand-in for the Tavily search API (``POST /search``)."""
+import argparse
+from http.server import ThreadingHTTPServer
+from typing import Optional
+
+from standin.common import LatencyInjector, StandInHandler, UpstreamStats
+
+
+def search_results(query: str, max_results: int = 5):
+    subject = query.replace("latest interesting news or fact about", "").replace("football", "").strip()
+    return [
+        {
+            "title": f"{subject}: story {i + 1}",
+            "url": f"https://example.com/news/{i + 1}",
+            "content": f"{subject} fact #{i + 1}: a stand-in nugget of trivia for load testing.",
+            "score": round(1 - i * 0.1, 2),
+        }
+        for i in range(max_results)
+    ]
+
+
+def make_handler(latency: Optional[LatencyInjector] = None, stats: Optional[UpstreamStats] = None):
+    latency = latency or LatencyInjector()
+    stats = stats or UpstreamStats()
+
+    class TavilyHandler(StandInHandler):
+        def do_POST(self):
+            stats.hit(self.path)
+            latency.sleep()
+            if self.path.rstrip("/") != "/search":
+                self.send_error(404)
+                return
+            body = self.read_json()
+            query = body.get("query", "")
+            self.send_json({
+                "query": query,
+                "answer": None,
+                "images": [],
+                "follow_up_questions": None,
+                "results": search_results(query, int(body.get("max_results") or 5)),
+                "response_time": latency.latency_ms / 1000,
+            })
+
+    return TavilyHandler
+
+
+def serve(
+    host: str = "127.0.0.1",
+    port: int = 8766,
+    latency: Optional[LatencyInjector] = None,
+    stats: Optional[UpstreamStats] = None
+) -> ThreadingHTTPServer:
+    return ThreadingHTTPServer((host, port), make_handler(latency, stats))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Stand-in Tavily search server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8766)
+    parser.add_argument("--latency-ms", type=float, default=0)
+    parser.add_argument("--jitter-ms", type=float, default=0)
+    args = parser.parse_args()
+
+    server = serve(args.host, args.port, LatencyInjector(args.latency_ms, args.jitter_ms))
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
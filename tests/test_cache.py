@@ -0,0 +1,65 @@
+import pytest
+
+from services.cache import SQLiteCache, TTLCache
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def cache(request, clock, tmp_path):
+    if request.param == "memory":
+        return TTLCache(60, max_entries=2, clock=clock)
+    return SQLiteCache(str(tmp_path / "cache.sqlite3"), "test", 60, max_entries=2, clock=clock)
+
+
+def test_fresh_entry_is_returned(cache):
+    cache.set("874", {"goals": 20})
+    assert cache.get("874") == {"goals": 20}
+
+
+def test_stale_entry_needs_allow_stale(cache, clock):
+    cache.set("874", {"goals": 20})
+    clock.now += 61
+    assert cache.get("874") is None
+    assert cache.get("874", allow_stale=True) == {"goals": 20}
+
+
+def test_pop_serves_an_entry_once(cache):
+    cache.set("874", {"commentary": "What a player"})
+    assert cache.pop("874") == {"commentary": "What a player"}
+    assert cache.pop("874") is None
+    assert cache.get("874", allow_stale=True) is None
+
+
+def test_pop_drops_stale_entries(cache, clock):
+    cache.set("874", {"commentary": "What a player"})
+    clock.now += 61
+    assert cache.pop("874") is None
+    assert cache.get("874", allow_stale=True) is None
+
+
+def test_oldest_entry_is_evicted(cache, clock):
+    for key in ("a", "b", "c"):
+        cache.set(key, key)
+        clock.now += 1
+    assert cache.get("a") is None
+    assert cache.get("b") == "b"
+    assert cache.get("c") == "c"
+
+
+def test_sqlite_cache_is_shared_between_instances(tmp_path, clock):
+    path = str(tmp_path / "cache.sqlite3")
+    SQLiteCache(path, "stats", 60, clock=clock).set("874", {"goals": 20})
+    assert SQLiteCache(path, "stats", 60, clock=clock).get("874") == {"goals": 20}
+    assert SQLiteCache(path, "facts", 60, clock=clock).get("874") is None
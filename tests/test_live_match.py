@@ -0,0 +1,148 @@
+import asyncio
+
+from services import live_match
+from services.live_match import EventDiffer, LiveMatchPoller, RunningScore, lineup_positions
+
+HOME, AWAY = 85, 541
+
+FIXTURE = {
+    "fixture": {"status": {"short": "2H", "elapsed": 70}},
+    "teams": {"home": {"id": HOME, "name": "PSG"}, "away": {"id": AWAY, "name": "Real Madrid"}},
+    "goals": {"home": 1, "away": 2},
+}
+
+
+def event(minute, team_id, player_id, type_="Goal", detail="Normal Goal", comments=None):
+    return {
+        "time": {"elapsed": minute, "extra": None},
+        "team": {"id": team_id, "name": "PSG" if team_id == HOME else "Real Madrid"},
+        "player": {"id": player_id, "name": f"Player {player_id}"},
+        "assist": {"id": None, "name": None},
+        "type": type_,
+        "detail": detail,
+        "comments": comments,
+    }
+
+
+def test_differ_yields_only_new_events():
+    differ = EventDiffer()
+    first = [event(12, AWAY, 762)]
+    second = first + [event(38, HOME, 128384, type_="Card", detail="Yellow Card")]
+    assert differ.diff(first) == first
+    assert differ.diff(first) == []
+    assert differ.diff(second) == second[1:]
+    assert differ.diff(second) == []
+
+
+def test_differ_catches_an_event_inserted_before_the_tail():
+    differ = EventDiffer()
+    tail = event(60, AWAY, 278)
+    differ.diff([tail])
+    late = event(55, HOME, 629, type_="subst", detail="Substitution 1")
+    assert differ.diff([late, tail]) == [late]
+
+
+def test_running_score_skips_missed_penalties_and_shootouts():
+    score = RunningScore()
+    score.set_teams(FIXTURE)
+    score.apply(event(12, AWAY, 762))
+    score.apply(event(30, HOME, 128384, detail="Missed Penalty"))
+    score.apply(event(38, HOME, 128384))
+    score.apply(event(40, HOME, 629, type_="Card", detail="Yellow Card"))
+    score.apply(event(120, HOME, 629, detail="Penalty", comments="Penalty Shootout"))
+    assert score.as_dict() == {"home": 1, "away": 1}
+
+
+def make_poller(monkeypatch, fixtures, snapshots, lineups=()):
+    monkeypatch.setattr(live_match, "get_fixture", lambda fixture_id: fixtures.pop(0))
+    monkeypatch.setattr(live_match, "get_fixture_events", lambda fixture_id: snapshots.pop(0))
+    monkeypatch.setattr(live_match, "get_fixture_lineups", lambda fixture_id: list(lineups))
+    monkeypatch.setattr(live_match, "get_fixture_statistics", lambda fixture_id: [])
+    return LiveMatchPoller("990001", asyncio.Queue(), lookup_attempts=2)
+
+
+def test_poller_skips_history_and_stamps_the_score_at_event_time(monkeypatch):
+    history = [event(12, AWAY, 762), event(38, HOME, 128384)]
+    later = history + [event(67, AWAY, 278, detail="Penalty"), event(84, HOME, 263482)]
+    poller = make_poller(monkeypatch, [FIXTURE, FIXTURE], [history, later])
+
+    assert asyncio.run(poller.poll_once()) == []
+    new_events = asyncio.run(poller.poll_once())
+    assert [(e["minute"], e["score"]) for e in new_events] == [
+        (67, {"home": 1, "away": 2}),
+        (84, {"home": 2, "away": 2}),
+    ]
+
+
+def test_poller_gives_up_on_an_unknown_fixture(monkeypatch):
+    poller = make_poller(monkeypatch, [None, None], [])
+    asyncio.run(poller.poll_once())
+    assert not poller.finished
+    asyncio.run(poller.poll_once())
+    assert poller.finished
+    assert "990001" in poller.error
+
+
+def test_var_cancelled_goal_is_taken_back():
+    score = RunningScore()
+    score.set_teams(FIXTURE)
+    score.apply(event(12, AWAY, 762))
+    score.apply(event(50, HOME, 128384))
+    score.apply(event(52, HOME, 128384, type_="Var", detail="Goal cancelled"))
+    score.apply(event(71, AWAY, 278, type_="Var", detail="Goal confirmed"))
+    assert score.as_dict() == {"home": 0, "away": 1}
+
+
+def test_poller_reconciles_a_removed_goal_with_the_header(monkeypatch):
+    header = {**FIXTURE, "goals": {"home": 1, "away": 1}}
+    ruled_out = {**FIXTURE, "goals": {"home": 0, "away": 1}}
+    goal = event(50, HOME, 128384)
+    card = event(60, AWAY, 762, type_="Card", detail="Yellow Card")
+    snapshots = [[event(12, AWAY, 762)], [event(12, AWAY, 762), goal], [event(12, AWAY, 762)], [event(12, AWAY, 762), card]]
+    poller = make_poller(monkeypatch, [header, header, ruled_out, ruled_out], snapshots)
+
+    asyncio.run(poller.poll_once())
+    assert asyncio.run(poller.poll_once())[0]["score"] == {"home": 1, "away": 1}
+    # The goal silently drops out of the feed; only the header knows
+    assert asyncio.run(poller.poll_once()) == []
+    assert asyncio.run(poller.poll_once())[0]["score"] == {"home": 0, "away": 1}
+
+
+def test_reconcile_never_raises_the_score_ahead_of_the_events():
+    score = RunningScore()
+    score.set_teams(FIXTURE)
+    score.reconcile({"home": 1, "away": 2})
+    assert score.as_dict() == {"home": 0, "away": 0}
+
+
+def lineup(team_id, *rows):
+    return {
+        "team": {"id": team_id, "name": "PSG" if team_id == HOME else "Real Madrid"},
+        "startXI": [
+            {"player": {"id": player_id, "name": f"Player {player_id}", "grid": f"{row}:{col}"}}
+            for row, line in enumerate(rows, start=1)
+            for col, player_id in enumerate(line, start=1)
+        ],
+    }
+
+
+def test_lineup_positions_put_home_on_the_left_and_mirror_away():
+    players = {p["id"]: p for p in lineup_positions([lineup(HOME, [1], [2, 3]), lineup(AWAY, [4], [5, 6])])}
+
+    assert (players[1]["x"], players[1]["y"]) == (5, 50)
+    assert players[2]["x"] == players[3]["x"] == 45
+    assert players[2]["y"] < players[3]["y"]
+    assert (players[4]["x"], players[5]["x"]) == (95, 55)
+    assert players[5]["y"] > players[6]["y"]
+
+
+def test_poller_keeps_the_lineup_current_through_substitutions(monkeypatch):
+    subst = {**event(58, HOME, 128384, type_="subst", detail="Substitution 1"), "assist": {"id": 1100, "name": "Zaire-Emery"}}
+    poller = make_poller(
+        monkeypatch, [FIXTURE, FIXTURE], [[], [subst]], lineups=[lineup(HOME, [1], [128384]), lineup(AWAY, [762])]
+    )
+
+    asyncio.run(poller.poll_once())
+    asyncio.run(poller.poll_once())
+    ids = {p["id"] for p in poller.lineup}
+    assert 1100 in ids and 128384 not in ids
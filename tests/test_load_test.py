@@ -0,0 +1,29 @@
+import pytest
+
+from benchmarks.load_test import compare, percentile
+
+
+def test_percentile_uses_nearest_rank():
+    values = [5, 1, 4, 2, 3]
+    assert percentile(values, 50) == 3
+    assert percentile(values, 95) == 5
+    assert percentile(values, 1) == 1
+    assert percentile([], 95) == 0.0
+
+
+@pytest.mark.parametrize("metric, current, regressed", [
+    ("latency_p95_s", 1.25, False),   # within 20% plus 0.05s slack
+    ("latency_p95_s", 1.30, True),
+    ("throughput_per_s", 8.0, False),  # lower is worse for throughput
+    ("throughput_per_s", 7.9, True),
+    ("peak_threads", 14, False),
+    ("peak_threads", 15, True),
+])
+def test_compare_applies_tolerance_and_slack(metric, current, regressed):
+    baseline = {"latency_p95_s": 1.0, "throughput_per_s": 10.0, "peak_threads": 10}
+    regressions = compare({**baseline, metric: current}, baseline, tolerance=0.2)
+    assert [r.split(":")[0] for r in regressions] == ([metric] if regressed else [])
+
+
+def test_compare_skips_metrics_missing_from_the_baseline():
+    assert compare({"latency_p95_s": 9.0, "degraded_ratio": 1.0}, {"degraded_ratio": 1.0}, tolerance=0.2) == []
@@ -0,0 +1,90 @@
+import threading
+import time
+
+import pytest
+
+from services.model_router import HedgeBudget, LatencyTracker, hedged_invoke
+
+
+class FakeLLM:
+    """Each call takes the next (delay, outcome) step; an exception outcome is raised"""
+
+    def __init__(self, *steps):
+        self.steps = list(steps)
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def invoke(self, messages):
+        with self._lock:
+            delay, outcome = self.steps[self.calls]
+            self.calls += 1
+        time.sleep(delay)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+
+def tracker():
+    # Always hedge after 50ms: too few samples for a p95
+    return LatencyTracker(default_ms=50, min_samples=1000)
+
+
+def funded_budget():
+    return HedgeBudget(ratio=1, burst=5)
+
+
+def test_p95_needs_enough_samples():
+    latencies = LatencyTracker(default_ms=4000, min_samples=20)
+    for _ in range(19):
+        latencies.record(0.1)
+    assert latencies.p95() is None
+    assert latencies.hedge_delay() == 4
+    for i in range(1, 22):
+        latencies.record(i / 10)
+    assert latencies.p95() == pytest.approx(2.0)
+    assert latencies.hedge_delay() == pytest.approx(2.0)
+
+
+def test_budget_allows_a_fraction_of_requests_to_hedge():
+    budget = HedgeBudget(ratio=0.25, burst=2)
+    assert not budget.try_spend()
+    for _ in range(4):
+        budget.deposit()
+    assert budget.try_spend()
+    assert not budget.try_spend()
+    for _ in range(20):
+        budget.deposit()
+    assert budget.try_spend() and budget.try_spend()
+    assert not budget.try_spend()
+
+
+def test_fast_primary_does_not_hedge():
+    llm = FakeLLM((0, "primary"))
+    assert hedged_invoke(llm, [], tracker(), funded_budget()) == "primary"
+    assert llm.calls == 1
+
+
+def test_slow_primary_is_beaten_by_the_hedge():
+    llm = FakeLLM((1.0, "primary"), (0, "hedge"))
+    start = time.monotonic()
+    assert hedged_invoke(llm, [], tracker(), funded_budget()) == "hedge"
+    assert time.monotonic() - start < 0.5
+    assert llm.calls == 2
+
+
+def test_fast_primary_failure_is_raised_without_hedging():
+    llm = FakeLLM((0, RuntimeError("rate limited")))
+    with pytest.raises(RuntimeError, match="rate limited"):
+        hedged_invoke(llm, [], tracker(), funded_budget())
+    assert llm.calls == 1
+
+
+def test_failed_primary_falls_back_to_the_hedge():
+    llm = FakeLLM((0.2, RuntimeError("timeout")), (0.3, "hedge"))
+    assert hedged_invoke(llm, [], tracker(), funded_budget()) == "hedge"
+
+
+def test_exhausted_budget_waits_for_the_primary():
+    llm = FakeLLM((0.2, "primary"), (0, "hedge"))
+    assert hedged_invoke(llm, [], tracker(), HedgeBudget(ratio=0, burst=5)) == "primary"
+    assert llm.calls == 1
@@ -0,0 +1,121 @@
+import asyncio
+
+import pytest
+
+from orchestration import prefetch
+from orchestration.prefetch import SpeculativePrefetcher
+from services.cache import TTLCache
+
+PLAYERS = [
+    {"id": 1, "name": "Keeper", "x": 10, "y": 50},
+    {"id": 2, "name": "Defender", "x": 30, "y": 50},
+    {"id": 3, "name": "Midfielder", "x": 50, "y": 50},
+    {"id": 4, "name": "Striker", "x": 80, "y": 50},
+]
+
+
+class FakeOrchestrator:
+    def __init__(self, run_s: float = 0.01, speculation_s: float = 0.05, degraded: bool = False):
+        self.run_s = run_s
+        self.speculation_s = speculation_s
+        self.degraded = degraded
+        self.runs = []
+        self.cancelled = []
+
+    async def run_agent_flow(self, player_id, player_name, deadline=None, cancel_event=None, speculative=False):
+        self.runs.append((player_id, speculative))
+        try:
+            await asyncio.sleep(self.speculation_s if speculative else self.run_s)
+        except asyncio.CancelledError:
+            self.cancelled.append(player_id)
+            raise
+        if self.degraded:
+            return {"commentary": f"{player_name} steps up.", "degraded": True}
+        result = {"commentary": f"What a player {player_name} is!"}
+        if speculative:
+            result["pending_facts"] = [{"player_name": player_name, "fact": f"{player_name} fact"}]
+        return result
+
+
+@pytest.fixture
+def recorded_facts(monkeypatch):
+    facts = []
+    monkeypatch.setattr(prefetch, "commentary_cache", TTLCache(60))
+    monkeypatch.setattr(prefetch, "record_fact", lambda player_name, fact: facts.append((player_name, fact)))
+    return facts
+
+
+def make_prefetcher(orchestrator):
+    return SpeculativePrefetcher(
+        orchestrator, PLAYERS, top_k=1, max_concurrent=4, max_jobs_per_window=10, idle_delay=0, enabled=True
+    )
+
+
+def test_ranks_neighbours_first_then_popular_players():
+    prefetcher = make_prefetcher(FakeOrchestrator())
+    assert [p["id"] for p in prefetcher.rank_candidates("2")] == [1, 3, 4]
+    for _ in range(3):
+        prefetcher.popularity.record("4")
+    assert prefetcher.rank_candidates("2")[0]["id"] == 4
+
+
+def test_next_pick_is_served_from_speculation_and_records_its_fact(recorded_facts):
+    async def run():
+        orchestrator = FakeOrchestrator()
+        prefetcher = make_prefetcher(orchestrator)
+        await prefetcher.get_commentary("1", "Keeper", "alice")
+        await asyncio.sleep(0.1)
+        assert orchestrator.runs == [("1", False), ("2", True)]
+        assert recorded_facts == []
+
+        result = await prefetcher.get_commentary("2", "Defender", "alice")
+        assert result["prefetched"]
+        assert "pending_facts" not in result
+        assert recorded_facts == [("Defender", "Defender fact")]
+    asyncio.run(run())
+
+
+def test_a_pick_only_cancels_its_own_sessions_speculation(recorded_facts):
+    async def run():
+        orchestrator = FakeOrchestrator(speculation_s=0.5)
+        prefetcher = make_prefetcher(orchestrator)
+        await prefetcher.get_commentary("1", "Keeper", "alice")
+        await asyncio.sleep(0.01)
+        await prefetcher.get_commentary("4", "Striker", "bob")
+        assert orchestrator.cancelled == []
+
+        await prefetcher.get_commentary("4", "Striker", "alice")
+        await asyncio.sleep(0.01)
+        assert orchestrator.cancelled == ["2"]
+    asyncio.run(run())
+
+
+def test_shared_speculation_survives_until_every_session_moves_on(recorded_facts):
+    async def run():
+        orchestrator = FakeOrchestrator(speculation_s=0.5)
+        prefetcher = make_prefetcher(orchestrator)
+        await asyncio.gather(
+            prefetcher.get_commentary("1", "Keeper", "alice"),
+            prefetcher.get_commentary("1", "Keeper", "bob"),
+        )
+        await asyncio.sleep(0.01)
+        assert [run for run in orchestrator.runs if run[1]] == [("2", True)]
+
+        await prefetcher.get_commentary("4", "Striker", "alice")
+        assert orchestrator.cancelled == []
+        result = await prefetcher.get_commentary("2", "Defender", "bob")
+        assert result["prefetched"]
+    asyncio.run(run())
+
+
+def test_a_pick_waiting_on_a_degraded_speculation_takes_its_answer(recorded_facts):
+    async def run():
+        orchestrator = FakeOrchestrator(speculation_s=0.2, degraded=True)
+        prefetcher = make_prefetcher(orchestrator)
+        await prefetcher.get_commentary("1", "Keeper", "alice")
+        await asyncio.sleep(0.01)
+
+        result = await prefetcher.get_commentary("2", "Defender", "alice")
+        assert result["degraded"]
+        assert ("2", False) not in orchestrator.runs
+    asyncio.run(run())
@@ -0,0 +1,105 @@
+import pytest
+
+from services.resilience import CircuitBreaker, CircuitOpenError
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+def make_breaker(clock, slo_ms=None):
+    return CircuitBreaker("upstream", slo_ms=slo_ms, failure_threshold=3, reset_timeout=30, clock=clock)
+
+
+def test_opens_after_consecutive_failures(clock):
+    breaker = make_breaker(clock)
+    for _ in range(2):
+        breaker.record(0.1, ok=False)
+    assert breaker.state == CircuitBreaker.CLOSED
+    breaker.record(0.1, ok=False)
+    assert breaker.state == CircuitBreaker.OPEN
+    assert breaker.is_open()
+    assert not breaker.allow()
+
+
+def test_success_resets_failure_count(clock):
+    breaker = make_breaker(clock)
+    breaker.record(0.1, ok=False)
+    breaker.record(0.1, ok=False)
+    breaker.record(0.1)
+    breaker.record(0.1, ok=False)
+    assert breaker.state == CircuitBreaker.CLOSED
+    assert breaker.failures == 1
+
+
+def test_slow_success_counts_as_failure(clock):
+    breaker = make_breaker(clock, slo_ms=500)
+    for _ in range(3):
+        breaker.record(0.6)
+    assert breaker.state == CircuitBreaker.OPEN
+
+
+def test_half_open_lets_one_trial_through_and_closes_on_success(clock):
+    breaker = make_breaker(clock)
+    for _ in range(3):
+        breaker.record(0.1, ok=False)
+    clock.now = 30
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+    assert not breaker.is_open()
+
+    assert breaker.allow()
+    assert breaker.is_open()
+    assert not breaker.allow()
+
+    breaker.record(0.1)
+    assert breaker.state == CircuitBreaker.CLOSED
+    assert breaker.allow()
+
+
+def test_failed_trial_reopens_for_another_reset_timeout(clock):
+    breaker = make_breaker(clock)
+    for _ in range(3):
+        breaker.record(0.1, ok=False)
+    clock.now = 30
+    assert breaker.allow()
+    breaker.record(0.1, ok=False)
+    assert breaker.state == CircuitBreaker.OPEN
+
+    clock.now = 59
+    assert breaker.is_open()
+    clock.now = 60
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+
+
+def test_call_rejects_while_open_and_measures_latency_with_clock(clock):
+    breaker = make_breaker(clock, slo_ms=1000)
+
+    def slow():
+        clock.now += 2
+        return "ok"
+
+    for _ in range(3):
+        assert breaker.call(slow) == "ok"
+    with pytest.raises(CircuitOpenError):
+        breaker.call(slow)
+
+
+def test_call_records_exceptions_as_failures(clock):
+    breaker = make_breaker(clock)
+
+    def boom():
+        raise ValueError("upstream down")
+
+    for _ in range(3):
+        with pytest.raises(ValueError):
+            breaker.call(boom)
+    assert breaker.state == CircuitBreaker.OPEN
@@ -0,0 +1,66 @@
+import asyncio
+
+import pytest
+
+from orchestration import fallback
+from server.app import CommentaryService, HTTPError, read_request
+
+
+def parse(raw: bytes):
+    async def run():
+        reader = asyncio.StreamReader()
+        reader.feed_data(raw)
+        reader.feed_eof()
+        return await read_request(reader)
+    return asyncio.run(run())
+
+
+def test_reads_body_by_content_length():
+    request = parse(b'POST /commentary HTTP/1.1\r\nContent-Length: 17\r\n\r\n{"player_id": 1}\n')
+    assert request.path == "/commentary"
+    assert request.json() == {"player_id": 1}
+    assert request.keep_alive
+
+
+def test_closed_connection_returns_none():
+    assert parse(b"") is None
+
+
+@pytest.mark.parametrize("length", [b"abc", b"-5"])
+def test_malformed_content_length_is_a_bad_request(length):
+    with pytest.raises(HTTPError) as error:
+        parse(b"POST /commentary HTTP/1.1\r\nContent-Length: " + length + b"\r\n\r\n")
+    assert error.value.status == 400
+
+
+def test_chunked_bodies_are_rejected():
+    raw = b"POST /commentary HTTP/1.1\r\nTransfer-Encoding: chunked\r\n\r\n5\r\nhello\r\n0\r\n\r\n"
+    with pytest.raises(HTTPError) as error:
+        parse(raw)
+    assert error.value.status == 411
+
+
+class SlowPrefetcher:
+    def __init__(self, run_s: float):
+        self.run_s = run_s
+        self.deadlines = []
+
+    async def get_commentary(self, player_id, player_name, session_id=None, deadline=None):
+        self.deadlines.append(deadline)
+        await asyncio.sleep(self.run_s)
+        return {"commentary": f"{player_name} on the ball"}
+
+
+def test_a_request_queued_past_the_deadline_gets_template_commentary(monkeypatch):
+    monkeypatch.setattr(fallback, "fallback_commentary", lambda player_id, name: {"commentary": name, "degraded": True})
+
+    async def run():
+        prefetcher = SlowPrefetcher(run_s=0.2)
+        service = CommentaryService(1, prefetcher)
+        service.deadline = 0.1
+        first, queued = await asyncio.gather(service.commentary("1", "Keeper"), service.commentary("2", "Defender"))
+        assert not first.get("degraded")
+        assert queued["degraded"]
+        assert prefetcher.deadlines == [pytest.approx(0.1, abs=0.01)]
+        assert not service.semaphore.locked()
+    asyncio.run(run())